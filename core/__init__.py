@@ -2,6 +2,13 @@
 Core module for ML-SuperTrend Trading Bot
 """
 
-from core.advanced_trading_bot import AdvancedTradingBot, BotConfig, StrategyConfig
-
 __all__ = ['AdvancedTradingBot', 'BotConfig', 'StrategyConfig']
+
+
+def __getattr__(name):
+    # Imported on first use, so importing another core module (e.g. the
+    # SuperTrend bot) does not load the advanced bot
+    if name in __all__:
+        from core import advanced_trading_bot
+        return getattr(advanced_trading_bot, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
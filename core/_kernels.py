@@ -0,0 +1,17 @@
+"""
+Numeric kernels
+The ahead-of-time build (python -m core._kernels_aot) when it exists,
+otherwise the Numba JIT versions from core._kernels_jit
+"""
+
+# The JIT module compiles every kernel on import, so try the AOT build first
+try:
+    from core._st_kernels import (
+        _rolling_mean, _score_signal, _supertrend_core, _supertrend_into, _supertrend_step,
+    )
+except ImportError:
+    from core._kernels_jit import (
+        _rolling_mean, _score_signal, _supertrend_core, _supertrend_into, _supertrend_step,
+    )
+
+__all__ = ['_rolling_mean', '_score_signal', '_supertrend_core', '_supertrend_into', '_supertrend_step']
@@ -0,0 +1,34 @@
+"""
+Ahead-of-time build of the numeric kernels
+Run `python -m core._kernels_aot` once per install to skip JIT at startup.
+The built functions do not check argument types the way the JIT does, so
+they must only be given the float64 (and int8 direction) arrays their
+signatures name.
+"""
+
+import os
+
+from numba.pycc import CC
+
+# Always built from the @njit definitions, even if an older build is present
+from core import _kernels_jit as _kernels
+
+cc = CC('_st_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Same signatures as the @njit declarations in core/_kernels_jit.py
+EXPORTS = {
+    '_supertrend_into': 'void(f8[:], f8[:], f8[:], i8, f8, f8[:], f8[:], i1[:], f8[:])',
+    '_supertrend_core': 'Tuple((f8[:], i1[:], f8[:]))(f8[:], f8[:], f8[:], i8, f8)',
+    '_rolling_mean': 'f8[:](f8[:], i8)',
+    '_supertrend_step': 'UniTuple(f8, 3)(f8[:], f8[:], f8[:], i8, i8, f8, f8)',
+    '_score_signal': 'Tuple((i8, i8, f8))(f8[:], i8, i8, i8)',
+}
+
+for name, signature in EXPORTS.items():
+    cc.export(name, signature)(getattr(_kernels, name).py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built {cc.name} in {cc.output_dir}")
@@ -0,0 +1,210 @@
+"""
+Numeric kernels, JIT versions
+Hot indicator loops compiled with Numba when available. Importing this
+module compiles them, so core._kernels only does so when there is no
+ahead-of-time build.
+"""
+
+import numpy as np
+
+from core._njit import NUMBA_AVAILABLE, njit
+
+
+@njit('void(f8[:], f8[:], f8[:], i8, f8, f8[:], f8[:], i1[:], f8[:])',
+      cache=True, fastmath={'contract'})
+def _supertrend_into(high, low, close, period, multiplier, tr, supertrend, direction, atr):
+    """True Range, ATR (simple mean), bands and direction in a single pass
+
+    Writes into the caller's tr/supertrend/direction/atr buffers, which
+    must be at least as long as close. The explicit signature compiles
+    eagerly at import, so with cache=True the JIT cost is paid once and
+    then loaded from disk. Only FMA contraction is enabled: the ATR warm-up
+    is NaN, which rules out the no-NaN fastmath flags.
+    """
+    n = close.shape[0]
+    tr_sum = 0.0
+    prev_upper = np.nan
+    prev_lower = np.nan
+
+    for i in range(n):
+        if i > 0:
+            tr[i] = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        else:
+            tr[i] = high[i] - low[i]
+        tr_sum += tr[i]
+        if i >= period:
+            tr_sum -= tr[i - period]
+        if i >= period - 1:
+            atr[i] = tr_sum / period
+        else:
+            atr[i] = np.nan
+
+        hl_avg = (high[i] + low[i]) / 2
+        upper = hl_avg + multiplier * atr[i]
+        lower = hl_avg - multiplier * atr[i]
+
+        if i >= period:
+            # +1 above the upper band, -1 below the lower band, 0 keeps the trend
+            d = int(close[i] > prev_upper) - int(close[i] < prev_lower)
+            direction[i] = d if d != 0 else direction[i - 1]
+            supertrend[i] = lower if direction[i] == 1 else upper
+        else:
+            direction[i] = 1
+            supertrend[i] = np.nan
+
+        prev_upper = upper
+        prev_lower = lower
+
+
+def _supertrend_into_numpy(high, low, close, period, multiplier, tr, supertrend, direction, atr):
+    """Vectorized NumPy version of _supertrend_into, used when Numba is missing
+
+    The direction carry becomes a forward fill: each bar takes the last
+    non-zero crossover at or before it, found with maximum.accumulate over
+    the indices of the non-zero entries.
+    """
+    n = close.shape[0]
+    if n == 0:
+        return
+
+    tr[0] = high[0] - low[0]
+    if n > 1:
+        prev_close = close[:-1]
+        np.maximum(high[1:] - low[1:], np.abs(high[1:] - prev_close), out=tr[1:n])
+        np.maximum(tr[1:n], np.abs(low[1:] - prev_close), out=tr[1:n])
+
+    atr[:n] = np.nan
+    if n >= period:
+        csum = np.cumsum(tr[:n])
+        atr[period - 1] = csum[period - 1] / period
+        atr[period:n] = (csum[period:] - csum[:-period]) / period
+
+    hl_avg = (high + low) / 2
+    upper = hl_avg + multiplier * atr[:n]
+    lower = hl_avg - multiplier * atr[:n]
+
+    # 1 before period (the seed), then +1 / -1 on a crossover and 0 to carry
+    raw = np.ones(n, np.int8)
+    raw[period:] = ((close[period:] > upper[period - 1:-1]).astype(np.int8)
+                    - (close[period:] < lower[period - 1:-1]))
+    last = np.where(raw != 0, np.arange(n), 0)
+    np.maximum.accumulate(last, out=last)
+    direction[:n] = raw[last]
+
+    supertrend[:n] = np.where(direction[:n] == 1, lower, upper)
+    supertrend[:min(period, n)] = np.nan
+
+
+@njit('Tuple((f8[:], i1[:], f8[:]))(f8[:], f8[:], f8[:], i8, f8)', cache=True)
+def _supertrend_core(high, low, close, period, multiplier):
+    """Allocating wrapper around _supertrend_into, returns (supertrend, direction, atr)"""
+    n = close.shape[0]
+    tr = np.empty(n)
+    supertrend = np.empty(n)
+    direction = np.empty(n, np.int8)
+    atr = np.empty(n)
+    _supertrend_into(high, low, close, period, multiplier, tr, supertrend, direction, atr)
+    return supertrend, direction, atr
+
+
+@njit('f8[:](f8[:], i8)', cache=True)
+def _rolling_mean(x, window):
+    """Simple moving average via a running sum, NaN for the first window-1 bars"""
+    n = x.shape[0]
+    out = np.empty(n)
+    total = 0.0
+
+    for i in range(n):
+        total += x[i]
+        if i >= window:
+            total -= x[i - window]
+        out[i] = total / window if i >= window - 1 else np.nan
+
+    return out
+
+
+@njit('UniTuple(f8, 3)(f8[:], f8[:], f8[:], i8, i8, f8, f8)',
+      cache=True, fastmath={'contract'})
+def _supertrend_step(high, low, close, i, period, multiplier, prev_direction):
+    """Advance the SuperTrend recurrence to bar i without allocating
+
+    Needs i > period. Returns (supertrend, direction, atr) for bar i.
+    """
+    prev_sum = 0.0
+    tr_i = 0.0
+    tr_first = 0.0
+    for j in range(i - period, i + 1):
+        tr = max(high[j] - low[j], abs(high[j] - close[j - 1]), abs(low[j] - close[j - 1]))
+        if j == i - period:
+            tr_first = tr
+        if j < i:
+            prev_sum += tr
+        else:
+            tr_i = tr
+    prev_atr = prev_sum / period
+    atr = (prev_sum - tr_first + tr_i) / period
+
+    prev_hl_avg = (high[i - 1] + low[i - 1]) / 2
+    hl_avg = (high[i] + low[i]) / 2
+
+    d = (int(close[i] > prev_hl_avg + multiplier * prev_atr)
+         - int(close[i] < prev_hl_avg - multiplier * prev_atr))
+    direction = float(d) if d != 0 else prev_direction
+    supertrend = hl_avg - multiplier * atr if direction == 1.0 else hl_avg + multiplier * atr
+    return supertrend, direction, atr
+
+
+@njit('UniTuple(f8, 2)(f8[:], i8)', cache=True)
+def _wilder_rsi_averages(close, period):
+    """Final Wilder-smoothed average gain and loss over a close series"""
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(1, period + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period + 1, close.shape[0]):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    return avg_gain, avg_loss
+
+
+@njit('Tuple((i8, i8, f8))(f8[:], i8, i8, i8)', cache=True)
+def _score_signal(close, prev_direction, direction, rsi_period):
+    """SuperTrend crossover plus RSI confirmation
+
+    Returns (signal, strength, rsi) with signal 1 = buy, -1 = sell, 0 = none.
+    """
+    rsi = 50.0
+    if close.shape[0] > rsi_period:
+        avg_gain, avg_loss = _wilder_rsi_averages(close, rsi_period)
+        if avg_loss == 0:
+            rsi = 100.0 if avg_gain > 0 else 50.0
+        else:
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    signal = 0
+    strength = 0
+    if prev_direction == -1 and direction == 1:
+        signal = 1
+        strength = 80 if rsi < 70 else 70
+    elif prev_direction == 1 and direction == -1:
+        signal = -1
+        strength = 80 if rsi > 30 else 70
+
+    return signal, strength, rsi
+
+
+if not NUMBA_AVAILABLE:
+    # The loop in _supertrend_into would run as plain Python
+    _supertrend_into = _supertrend_into_numpy
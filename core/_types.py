@@ -0,0 +1,71 @@
+"""
+Data types shared by both bots
+Candle columns and per-symbol indicator buffers
+"""
+
+import numpy as np
+from dataclasses import dataclass
+
+
+@dataclass
+class Bars:
+    """Candle data as column arrays (views into the MT5 rates array)"""
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    
+    @classmethod
+    def from_rates(cls, rates: np.ndarray) -> "Bars":
+        """Wrap the structured array returned by mt5.copy_rates_*"""
+        return cls(
+            time=rates['time'],
+            open=rates['open'].astype(np.float64, copy=False),
+            high=rates['high'].astype(np.float64, copy=False),
+            low=rates['low'].astype(np.float64, copy=False),
+            close=rates['close'].astype(np.float64, copy=False),
+            volume=rates['tick_volume'],
+        )
+    
+    def __len__(self) -> int:
+        return len(self.close)
+    
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Build a DataFrame for consumers that need one"""
+        import pandas as pd
+        
+        return pd.DataFrame({
+            'time': pd.to_datetime(self.time, unit='s'),
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'volume': self.volume,
+        })
+
+
+@dataclass(slots=True)
+class SymbolScratch:
+    """Indicator output buffers reused across cycles for one symbol"""
+    tr: np.ndarray
+    supertrend: np.ndarray
+    direction: np.ndarray
+    atr: np.ndarray
+    
+    @classmethod
+    def allocate(cls, capacity: int = 512) -> "SymbolScratch":
+        """Allocate buffers for up to capacity bars"""
+        return cls(
+            tr=np.empty(capacity),
+            supertrend=np.empty(capacity),
+            direction=np.empty(capacity, dtype=np.int8),
+            atr=np.empty(capacity),
+        )
+    
+    def fit(self, n: int) -> "SymbolScratch":
+        """Return buffers with room for n bars, growing only when needed"""
+        if n > len(self.tr):
+            return SymbolScratch.allocate(max(n, 2 * len(self.tr)))
+        return self
@@ -4,15 +4,18 @@ Advanced auto-trading with SuperTrend indicator, risk management, and multiple s
 """
 
 import MetaTrader5 as mt5
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
+from core._kernels import _score_signal, _supertrend_core, _supertrend_into, _supertrend_step
+from core._types import Bars, SymbolScratch
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,7 +32,7 @@ class TimeFrame(Enum):
     D1 = 16408
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyConfig:
     """Strategy configuration"""
     name: str = "Advanced"
@@ -45,7 +48,7 @@ class StrategyConfig:
     trailing_distance: float = 1.5
 
 
-@dataclass
+@dataclass(slots=True)
 class BotConfig:
     """Bot configuration"""
     login: int = 0
@@ -62,6 +65,80 @@ class BotConfig:
     deviation: int = 20
 
 
+@dataclass(slots=True)
+class SymbolSpec:
+    """Static contract details of a symbol, fetched once per session"""
+    point: float
+    trade_contract_size: float
+    currency_profit: str
+    volume_min: float
+    volume_max: float
+    
+    @classmethod
+    def from_info(cls, info) -> "SymbolSpec":
+        """Build from an mt5.symbol_info result"""
+        return cls(
+            point=info.point,
+            trade_contract_size=info.trade_contract_size,
+            currency_profit=info.currency_profit,
+            volume_min=info.volume_min,
+            volume_max=info.volume_max,
+        )
+
+
+class BarsBuffer:
+    """Rolling window of MT5 rates for one symbol, refreshed by bar time
+    
+    After the first full fetch only the newest few bars are requested each
+    poll and spliced in at the matching bar time. Storage is a linear array
+    of twice the window that is compacted when full, so the latest bars are
+    always a contiguous view and never need a copy.
+    """
+    
+    def __init__(self, window: int = 256):
+        self.window = window
+        self._data: Optional[np.ndarray] = None
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def reset(self, rates: np.ndarray):
+        """Replace the contents with a full fetch"""
+        n = min(len(rates), self.window)
+        if self._data is None or self._data.dtype != rates.dtype:
+            self._data = np.empty(2 * self.window, dtype=rates.dtype)
+        self._data[:n] = rates[len(rates) - n:]
+        self._size = n
+    
+    def merge(self, rates: np.ndarray) -> bool:
+        """Splice in the newest rates; False if they do not overlap the buffer"""
+        if self._size == 0 or len(rates) == 0 or len(rates) > self.window:
+            return False
+        
+        times = self._data['time'][:self._size]
+        first = rates['time'][0]
+        start = int(np.searchsorted(times, first))
+        if start >= self._size or times[start] != first:
+            return False
+        
+        end = start + len(rates)
+        if end > len(self._data):
+            # Keep only the last window bars, moved to the front
+            drop = end - self.window
+            self._data[:start - drop] = self._data[drop:start]
+            start -= drop
+            end -= drop
+        
+        self._data[start:end] = rates
+        self._size = end
+        return True
+    
+    def view(self, n: int) -> np.ndarray:
+        """The latest n bars (a view, valid until the next update)"""
+        return self._data[max(0, self._size - n):self._size]
+
+
 class NewsFilter:
     """News filter to avoid trading during high-impact news"""
     
@@ -70,14 +147,26 @@ class NewsFilter:
         self.high_impact_events = [
             "Non-Farm Payrolls", "FOMC", "ECB", "BOE", "CPI", "GDP", "NFP"
         ]
+        # The rules only depend on weekday and hour, so a verdict holds until the next hour
+        self._verdict = (True, "Safe to trade")
+        self._verdict_expires = 0.0
     
     def should_trade(self) -> tuple[bool, str]:
         """Check if it's safe to trade"""
         if not self.enabled:
             return True, "News filter disabled"
         
-        now = datetime.now()
+        if time.time() >= self._verdict_expires:
+            now = datetime.now()
+            self._verdict = self._check_session(now)
+            next_hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+            self._verdict_expires = next_hour.timestamp()
         
+        return self._verdict
+    
+    @staticmethod
+    def _check_session(now: datetime) -> tuple[bool, str]:
+        """Apply the weekday/hour trading rules"""
         # Avoid Friday after 4 PM
         if now.weekday() == 4 and now.hour >= 16:
             return False, "Friday evening - no trading"
@@ -97,16 +186,21 @@ class RiskManager:
         self.daily_loss = 0.0
         self.daily_trades = 0
         self.last_reset = datetime.now().date()
+        self._next_reset = self._next_midnight(self.last_reset)
+    
+    @staticmethod
+    def _next_midnight(day) -> float:
+        """Epoch seconds of the local midnight following the given date"""
+        return datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
     
     def can_trade(self) -> tuple[bool, str]:
         """Check if we can trade based on risk rules"""
-        today = datetime.now().date()
-        
-        # Reset daily counters
-        if today > self.last_reset:
+        # Reset daily counters (one float compare except at midnight)
+        if time.time() >= self._next_reset:
             self.daily_loss = 0.0
             self.daily_trades = 0
-            self.last_reset = today
+            self.last_reset = datetime.now().date()
+            self._next_reset = self._next_midnight(self.last_reset)
         
         # Check daily loss
         if self.daily_loss <= -self.config.max_daily_loss:
@@ -118,28 +212,27 @@ class RiskManager:
         
         return True, "Can trade"
     
-    def calculate_lot_size(self, account_balance: float, symbol: str, stop_loss_pips: float) -> float:
+    def calculate_lot_size(self, account_balance: float, spec: Optional[SymbolSpec],
+                           stop_loss_pips: float) -> float:
         """Calculate lot size based on risk percentage"""
         risk_amount = account_balance * (self.config.strategies[0].risk_percent / 100)
         
-        # Get symbol info
-        symbol_info = mt5.symbol_info(symbol)
-        if not symbol_info:
+        if spec is None:
             return 0.01
         
         # Calculate lot size
-        point = symbol_info.point
-        contract_size = symbol_info.trade_contract_size
+        point = spec.point
+        contract_size = spec.trade_contract_size
         
         # For forex pairs
-        if symbol_info.currency_profit == "USD":
-            lot_size = risk_amount / (stop_loss_pips * point * contract_size / symbol_info.point)
+        if spec.currency_profit == "USD":
+            lot_size = risk_amount / (stop_loss_pips * point * contract_size / spec.point)
         else:
             # For other pairs, simplified calculation
             lot_size = risk_amount / (stop_loss_pips * 10)
         
         # Apply min/max limits
-        lot_size = max(symbol_info.volume_min, min(lot_size, symbol_info.volume_max))
+        lot_size = max(spec.volume_min, min(lot_size, spec.volume_max))
         return round(lot_size, 2)
 
 
@@ -149,52 +242,86 @@ class SuperTrendIndicator:
     def __init__(self, period: int = 10, multiplier: float = 3.0):
         self.period = period
         self.multiplier = multiplier
+        # Per-symbol (bar_time, (supertrend, direction, atr)) of the last closed bar
+        self._state: Dict[str, tuple] = {}
+        self._scratch: Dict[str, SymbolScratch] = {}
     
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate SuperTrend indicator"""
-        high = df['high']
-        low = df['low']
-        close = df['close']
-        
-        # True Range
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(self.period).mean()
-        
-        # SuperTrend calculation
-        hl_avg = (high + low) / 2
-        upper_band = hl_avg + (self.multiplier * atr)
-        lower_band = hl_avg - (self.multiplier * atr)
-        
-        # Initialize SuperTrend
-        supertrend = pd.Series(index=df.index, dtype=float)
-        direction = pd.Series(1, index=df.index)
-        
-        for i in range(self.period, len(df)):
-            if close.iloc[i] > upper_band.iloc[i-1]:
-                direction.iloc[i] = 1
-            elif close.iloc[i] < lower_band.iloc[i-1]:
-                direction.iloc[i] = -1
-            else:
-                direction.iloc[i] = direction.iloc[i-1]
-            
-            if direction.iloc[i] == 1:
-                supertrend.iloc[i] = lower_band.iloc[i]
-            else:
-                supertrend.iloc[i] = upper_band.iloc[i]
-        
-        df['supertrend'] = supertrend
-        df['trend_direction'] = direction
-        df['atr'] = atr
+    def calculate(self, bars: Bars, out: Optional[SymbolScratch] = None) -> Dict[str, np.ndarray]:
+        """Calculate SuperTrend indicator
+        
+        With out given, results are views into its buffers and are only
+        valid until the buffers are reused.
+        """
+        if out is None:
+            supertrend, direction, atr = _supertrend_core(
+                bars.high, bars.low, bars.close, self.period, self.multiplier
+            )
+        else:
+            n = len(bars)
+            supertrend, direction, atr = out.supertrend[:n], out.direction[:n], out.atr[:n]
+            _supertrend_into(
+                bars.high, bars.low, bars.close, self.period, self.multiplier,
+                out.tr[:n], supertrend, direction, atr
+            )
         
-        return df
+        return {
+            'supertrend': supertrend,
+            'trend_direction': direction,
+            'atr': atr,
+        }
+    
+    def calculate_incremental(self, bars: Bars, key: str = "") -> Dict[str, np.ndarray]:
+        """Update SuperTrend for the newest bars only and return the last two values
+        
+        The last bar is the one still forming, so state is committed for the
+        bar before it. The first call for a key, or any gap in bar times,
+        falls back to a full calculate().
+        """
+        n = len(bars)
+        state = self._state.get(key)
+        
+        if state is not None and n >= self.period + 3:
+            bar_time, previous = state
+            if bars.time[-3] == bar_time:
+                # One bar closed since the last call
+                previous = self._step(bars, n - 2, previous[1])
+                self._state[key] = (bars.time[-2], previous)
+            elif bars.time[-2] != bar_time:
+                previous = None
+            
+            if previous is not None:
+                current = self._step(bars, n - 1, previous[1])
+                return {
+                    'supertrend': np.array([previous[0], current[0]]),
+                    'trend_direction': np.array([previous[1], current[1]], dtype=np.int8),
+                    'atr': np.array([previous[2], current[2]]),
+                }
+        
+        scratch = self._scratch.get(key)
+        scratch = self._scratch[key] = (scratch or SymbolScratch.allocate()).fit(n)
+        result = self.calculate(bars, out=scratch)
+        if n >= 2:
+            self._state[key] = (bars.time[-2], (
+                result['supertrend'][-2], result['trend_direction'][-2], result['atr'][-2]
+            ))
+        return {name: values[-2:].copy() for name, values in result.items()}
+    
+    def _step(self, bars: Bars, i: int, prev_direction: int) -> tuple:
+        """Advance the SuperTrend recurrence by one bar"""
+        supertrend, direction, atr = _supertrend_step(
+            bars.high, bars.low, bars.close, i, self.period, self.multiplier, prev_direction
+        )
+        return supertrend, int(direction), atr
 
 
 class AdvancedTradingBot:
     """Advanced Trading Bot with SuperTrend"""
     
+    # Bars re-fetched per poll once the bar cache is warm
+    DELTA_BARS = 8
+    RSI_PERIOD = 14
+    _SIGNALS = {1: "buy", -1: "sell", 0: "none"}
+    
     def __init__(self, config: BotConfig):
         self.config = config
         self.news_filter = NewsFilter(config.news_filter_enabled)
@@ -202,6 +329,11 @@ class AdvancedTradingBot:
         self.supertrend = SuperTrendIndicator()
         self.running = False
         self.positions = []
+        self.symbol_specs: Dict[str, SymbolSpec] = {}
+        self._bars_cache: Dict[tuple, BarsBuffer] = {}
+        # MT5 calls are terminal round trips, so per-symbol fetches run concurrently;
+        # the pool is made by start() and shut down by disconnect()
+        self._pool: Optional[ThreadPoolExecutor] = None
         
     def connect(self) -> bool:
         """Connect to MT5"""
@@ -235,101 +367,102 @@ class AdvancedTradingBot:
         for symbol in self.config.symbols:
             if not mt5.symbol_select(symbol, True):
                 logger.warning(f"Failed to select {symbol}")
+                continue
+            self._symbol_spec(symbol)
         
         return True
     
+    def _symbol_spec(self, symbol: str) -> Optional[SymbolSpec]:
+        """Get the cached contract spec for a symbol, fetching it on first use"""
+        spec = self.symbol_specs.get(symbol)
+        if spec is None:
+            info = mt5.symbol_info(symbol)
+            if info is None:
+                return None
+            spec = self.symbol_specs[symbol] = SymbolSpec.from_info(info)
+        return spec
+    
     def disconnect(self):
         """Disconnect from MT5"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
         mt5.shutdown()
         logger.info("Disconnected from MT5")
     
-    def get_data(self, symbol: str, timeframe: int, bars: int = 100) -> Optional[pd.DataFrame]:
-        """Get candle data for a symbol"""
+    def get_data(self, symbol: str, timeframe: int, bars: int = 100) -> Optional[Bars]:
+        """Get candle data for a symbol
+        
+        Bars are cached per symbol/timeframe; once the cache is warm only
+        the last few bars are fetched from the terminal.
+        """
+        buffer = self._bars_cache.get((symbol, timeframe))
+        if buffer is None or buffer.window < bars:
+            buffer = self._bars_cache[(symbol, timeframe)] = BarsBuffer(max(bars, 256))
+        
+        if len(buffer) >= bars:
+            rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, self.DELTA_BARS)
+            if rates is not None and buffer.merge(rates):
+                return Bars.from_rates(buffer.view(bars))
+        
         rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, bars)
         if rates is None:
             return None
         
-        df = pd.DataFrame(rates)
-        df['time'] = pd.to_datetime(df['time'], unit='s')
-        df = df.rename(columns={
-            'time': 'time',
-            'open': 'open',
-            'high': 'high',
-            'low': 'low',
-            'close': 'close',
-            'tick_volume': 'volume'
-        })
-        
-        return df
+        buffer.reset(rates)
+        return Bars.from_rates(buffer.view(bars))
+    
+    def _fetch_symbol_snapshot(self, symbol: str) -> tuple:
+        """Fetch (bars, symbol_info, tick) for one symbol"""
+        return (
+            self.get_data(symbol, self.config.timeframe),
+            mt5.symbol_info(symbol),
+            mt5.symbol_info_tick(symbol),
+        )
     
-    def analyze(self, symbol: str) -> Dict[str, Any]:
+    def analyze(self, symbol: str, bars: Optional[Bars] = None) -> Dict[str, Any]:
         """Analyze symbol and return signals"""
-        df = self.get_data(symbol, self.config.timeframe)
-        if df is None or len(df) < 50:
+        if bars is None:
+            bars = self.get_data(symbol, self.config.timeframe)
+        if bars is None or len(bars) < 50:
             return {"signal": "none", "strength": 0, "reason": "Insufficient data"}
         
         # Calculate SuperTrend
-        df = self.supertrend.calculate(df)
-        
-        # Get latest values
-        current = df.iloc[-1]
-        previous = df.iloc[-2]
-        
-        # Signal detection
-        signal = "none"
-        strength = 0
-        
-        # SuperTrend crossover
-        if previous['trend_direction'] == -1 and current['trend_direction'] == 1:
-            signal = "buy"
-            strength = 70
-        elif previous['trend_direction'] == 1 and current['trend_direction'] == -1:
-            signal = "sell"
-            strength = 70
-        
-        # RSI confirmation
-        rsi = self._calculate_rsi(df)
-        if signal == "buy" and rsi < 70:
-            strength += 10
-        elif signal == "sell" and rsi > 30:
-            strength += 10
+        st = self.supertrend.calculate_incremental(bars, symbol)
+        
+        # Crossover signal and RSI confirmation in one kernel call
+        direction = st['trend_direction']
+        signal, strength, rsi = _score_signal(
+            bars.close, int(direction[-2]), int(direction[-1]), self.RSI_PERIOD
+        )
         
         return {
-            "signal": signal,
-            "strength": min(strength, 100),
-            "price": current['close'],
-            "supertrend": current['supertrend'],
-            "atr": current['atr'],
+            "signal": self._SIGNALS[signal],
+            "strength": strength,
+            "price": bars.close[-1],
+            "supertrend": st['supertrend'][-1],
+            "atr": st['atr'][-1],
             "rsi": rsi
         }
     
-    def _calculate_rsi(self, df: pd.DataFrame, period: int = 14) -> float:
-        """Calculate RSI"""
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi.iloc[-1] if not rsi.empty else 50
-    
     def place_order(self, symbol: str, order_type: str, lot_size: float, 
-                    sl_pips: float, tp_pips: float) -> bool:
+                    sl_pips: float, tp_pips: float, tick=None) -> bool:
         """Place a trade order"""
-        symbol_info = mt5.symbol_info(symbol)
-        if not symbol_info:
+        spec = self._symbol_spec(symbol)
+        if not spec:
             return False
         
-        point = symbol_info.point
+        point = spec.point
+        if tick is None:
+            tick = mt5.symbol_info_tick(symbol)
         
         if order_type == "buy":
-            price = mt5.symbol_info_tick(symbol).ask
+            price = tick.ask
             sl = price - sl_pips * point
             tp = price + tp_pips * point
             order_type_enum = mt5.ORDER_TYPE_BUY
         else:
-            price = mt5.symbol_info_tick(symbol).bid
+            price = tick.bid
             sl = price + sl_pips * point
             tp = price - tp_pips * point
             order_type_enum = mt5.ORDER_TYPE_SELL
@@ -352,81 +485,87 @@ class AdvancedTradingBot:
         result = mt5.order_send(request)
         
         if result.retcode != mt5.TRADE_RETCODE_DONE:
-            logger.error(f"Order failed: {result.comment}")
+            logger.error("Order failed: %s", result.comment)
             return False
         
-        logger.info(f"Order placed: {order_type} {lot_size} {symbol} at {price}")
+        logger.info("Order placed: %s %s %s at %s", order_type, lot_size, symbol, price)
         self.risk_manager.daily_trades += 1
         
         return True
     
-    def check_positions(self) -> List[Dict]:
-        """Get open positions"""
+    def check_positions(self) -> tuple:
+        """Get open positions as the raw MT5 position records"""
         positions = mt5.positions_get()
         if positions is None:
-            return []
-        
-        return [
-            {
-                "ticket": p.ticket,
-                "symbol": p.symbol,
-                "type": "buy" if p.type == 0 else "sell",
-                "volume": p.volume,
-                "profit": p.profit,
-                "open_price": p.price_open,
-                "sl": p.sl,
-                "tp": p.tp
-            }
-            for p in positions
-        ]
+            return ()
+        
+        return positions
     
-    def manage_positions(self):
+    def manage_positions(self, ticks: Optional[Dict[str, Any]] = None):
         """Manage open positions (trailing stop, partial close)"""
         positions = self.check_positions()
-        strategy = self.config.strategies[0]
+        if not positions:
+            return
         
-        for pos in positions:
-            # Calculate profit in pips
-            if pos['type'] == 'buy':
-                profit_pips = (pos['open_price'] - mt5.symbol_info_tick(pos['symbol']).bid) / pos['open_price'] * 10000
-            else:
-                profit_pips = (mt5.symbol_info_tick(pos['symbol']).ask - pos['open_price']) / pos['open_price'] * 10000
+        strategy = self.config.strategies[0]
+        ticks = {} if ticks is None else ticks
+        
+        n = len(positions)
+        symbols = [p.symbol for p in positions]
+        for symbol in set(symbols):
+            if ticks.get(symbol) is None:
+                ticks[symbol] = mt5.symbol_info_tick(symbol)
+        
+        # Profit in pips for all positions at once
+        is_buy = np.fromiter((p.type == 0 for p in positions), dtype=bool, count=n)
+        open_prices = np.fromiter((p.price_open for p in positions), dtype=np.float64, count=n)
+        bids = np.fromiter((ticks[s].bid for s in symbols), dtype=np.float64, count=n)
+        asks = np.fromiter((ticks[s].ask for s in symbols), dtype=np.float64, count=n)
+        profit_pips = np.where(is_buy, open_prices - bids, asks - open_prices) / open_prices * 10000
+        
+        trail = (profit_pips >= strategy.trailing_start_at) & strategy.use_trailing
+        partial = (profit_pips >= strategy.partial_close_at_profit) & strategy.use_partial_close
+        
+        # Only visit positions that need an action
+        for i in np.flatnonzero(trail | partial):
+            pos = positions[i]
             
             # Trailing stop
-            if strategy.use_trailing and profit_pips >= strategy.trailing_start_at:
-                self._update_trailing_stop(pos, profit_pips, strategy)
+            if trail[i]:
+                self._update_trailing_stop(pos, profit_pips[i], strategy)
             
             # Partial close
-            if strategy.use_partial_close and profit_pips >= strategy.partial_close_at_profit:
+            if partial[i]:
                 self._partial_close(pos, strategy)
     
-    def _update_trailing_stop(self, pos: Dict, profit_pips: float, strategy: StrategyConfig):
+    def _update_trailing_stop(self, pos, profit_pips: float, strategy: StrategyConfig):
         """Update trailing stop"""
-        symbol_info = mt5.symbol_info(pos['symbol'])
-        point = symbol_info.point
+        point = self._symbol_spec(pos.symbol).point
         
-        new_sl = pos['open_price'] + (strategy.trailing_distance * point * 10) if pos['type'] == 'buy' else pos['open_price'] - (strategy.trailing_distance * point * 10)
+        new_sl = pos.price_open + (strategy.trailing_distance * point * 10) if pos.type == 0 else pos.price_open - (strategy.trailing_distance * point * 10)
+        if abs(pos.sl - new_sl) < point / 2:
+            return  # already at this stop
         
         request = {
             "action": mt5.TRADE_ACTION_SLTP,
-            "symbol": pos['symbol'],
-            "position": pos['ticket'],
+            "symbol": pos.symbol,
+            "position": pos.ticket,
             "sl": new_sl,
-            "tp": pos['tp'],
+            "tp": pos.tp,
         }
         
         mt5.order_send(request)
     
-    def _partial_close(self, pos: Dict, strategy: StrategyConfig):
+    def _partial_close(self, pos, strategy: StrategyConfig):
         """Partially close a position"""
-        close_volume = pos['volume'] * (strategy.partial_close_percent / 100)
+        close_volume = pos.volume * (strategy.partial_close_percent / 100)
         
         request = {
             "action": mt5.TRADE_ACTION_DEAL,
-            "symbol": pos['symbol'],
+            "symbol": pos.symbol,
             "volume": close_volume,
-            "type": mt5.ORDER_TYPE_SELL if pos['type'] == 'buy' else mt5.ORDER_TYPE_BUY,
-            "position": pos['ticket'],
+            "type": mt5.ORDER_TYPE_SELL if pos.type == 0 else mt5.ORDER_TYPE_BUY,
+            "position": pos.ticket,
             "deviation": self.config.deviation,
             "magic": self.config.magic_number,
             "comment": "Partial close",
@@ -434,63 +573,89 @@ class AdvancedTradingBot:
         
         result = mt5.order_send(request)
         if result.retcode == mt5.TRADE_RETCODE_DONE:
-            logger.info(f"Partial close: {close_volume} {pos['symbol']}")
+            logger.info("Partial close: %s %s", close_volume, pos.symbol)
     
     def start(self, interval: int = 60):
-        """Start the trading bot"""
+        """Start the trading bot
+        
+        Config values are read once here, so changes made while running
+        take effect on the next start().
+        """
         self.running = True
         logger.info("Bot started trading...")
         
+        # Loop invariants
+        symbols = tuple(self.config.symbols)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=max(1, min(8, len(symbols))))
+        strategy = self.config.strategies[0]
+        min_strength = strategy.min_strength
+        max_spread_points = self.config.max_spread * 10
+        can_trade_risk = self.risk_manager.can_trade
+        should_trade_news = self.news_filter.should_trade
+        manage_positions = self.manage_positions
+        analyze = self.analyze
+        place_order = self.place_order
+        calculate_lot_size = self.risk_manager.calculate_lot_size
+        symbol_spec = self._symbol_spec
+        fetch_snapshots = self._pool.map
+        fetch_snapshot = self._fetch_symbol_snapshot
+        sleep = time.sleep
+        
         while self.running:
             try:
                 # Check risk management
-                can_trade, reason = self.risk_manager.can_trade()
+                can_trade, reason = can_trade_risk()
                 if not can_trade:
-                    logger.warning(f"Cannot trade: {reason}")
-                    time.sleep(interval)
+                    logger.warning("Cannot trade: %s", reason)
+                    sleep(interval)
                     continue
                 
                 # Check news filter
-                can_trade, reason = self.news_filter.should_trade()
+                can_trade, reason = should_trade_news()
                 if not can_trade:
-                    logger.info(f"Skipping trade: {reason}")
-                    time.sleep(interval)
+                    logger.info("Skipping trade: %s", reason)
+                    sleep(interval)
                     continue
                 
+                # Snapshot bars, live symbol info (spread) and ticks once per cycle
+                snapshots = dict(zip(symbols, fetch_snapshots(fetch_snapshot, symbols)))
+                ticks = {s: snapshot[2] for s, snapshot in snapshots.items()}
+                
                 # Manage existing positions
-                self.manage_positions()
+                manage_positions(ticks)
                 
                 # Analyze each symbol
-                for symbol in self.config.symbols:
+                for symbol in symbols:
+                    bars, info, tick = snapshots[symbol]
+                    
                     # Check spread
-                    symbol_info = mt5.symbol_info(symbol)
-                    if symbol_info and symbol_info.spread > self.config.max_spread * 10:
-                        logger.warning(f"Spread too high for {symbol}")
+                    if info and info.spread > max_spread_points:
+                        logger.warning("Spread too high for %s", symbol)
                         continue
                     
-                    analysis = self.analyze(symbol)
-                    strategy = self.config.strategies[0]
+                    analysis = analyze(symbol, bars)
                     
-                    if analysis['strength'] >= strategy.min_strength:
+                    if analysis['strength'] >= min_strength:
                         # Calculate lot size
                         account_info = mt5.account_info()
-                        lot_size = self.risk_manager.calculate_lot_size(
+                        lot_size = calculate_lot_size(
                             account_info.balance,
-                            symbol,
+                            symbol_spec(symbol),
                             analysis['atr'] * 2
                         )
                         
                         # Place trade
                         if analysis['signal'] == 'buy':
-                            self.place_order(symbol, "buy", lot_size, 2.0, 3.0)
+                            place_order(symbol, "buy", lot_size, 2.0, 3.0, tick=tick)
                         elif analysis['signal'] == 'sell':
-                            self.place_order(symbol, "sell", lot_size, 2.0, 3.0)
+                            place_order(symbol, "sell", lot_size, 2.0, 3.0, tick=tick)
                 
-                time.sleep(interval)
+                sleep(interval)
                 
             except Exception as e:
-                logger.error(f"Error in trading loop: {e}")
-                time.sleep(interval)
+                logger.error("Error in trading loop: %s", e)
+                sleep(interval)
     
     def stop(self):
         """Stop the trading bot"""
@@ -0,0 +1,40 @@
+"""
+MT5 credentials from the environment
+MT5_LOGIN, MT5_PASSWORD and MT5_SERVER (set directly or via .env) override
+the configured account in both runners
+"""
+
+import functools
+import logging
+import os
+from types import MappingProxyType
+from typing import Mapping
+
+logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def mt5_env_overrides() -> Mapping:
+    """Account fields set in the environment, parsed once per process
+
+    Only variables that are set are included; an empty MT5_LOGIN or
+    MT5_SERVER counts as unset, an empty MT5_PASSWORD does not.
+    """
+    overrides = {}
+
+    login = os.getenv("MT5_LOGIN")
+    if login:
+        try:
+            overrides["login"] = int(login)
+        except ValueError:
+            logger.warning("MT5_LOGIN must be a number, ignoring")
+
+    password = os.getenv("MT5_PASSWORD")
+    if password is not None:
+        overrides["password"] = password
+
+    server = os.getenv("MT5_SERVER")
+    if server:
+        overrides["server"] = server
+
+    return MappingProxyType(overrides)
@@ -3,27 +3,157 @@ Performance Monitor
 Track and analyze trading performance
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 import json
 from pathlib import Path
+from types import MappingProxyType
+
+
+_REPORT_TEMPLATE = """
+╔═══════════════════════════════════════════════════════════╗
+║            PERFORMANCE REPORT - Last {days} Days                ║
+╠═══════════════════════════════════════════════════════════╣
+║  Total Trades:     {total_trades:<35}║
+║  Winning Trades:   {winning_trades:<35}║
+║  Losing Trades:   {losing_trades:<35}║
+║  Win Rate:        {win_rate:.1f}%                                ║
+╠═══════════════════════════════════════════════════════════╣
+║  Total Profit:    ${total_profit:<34}║
+║  Average Profit:  ${avg_profit:<34}║
+║  Best Trade:      ${best_trade:<34}║
+║  Worst Trade:     ${worst_trade:<34}║
+╚═══════════════════════════════════════════════════════════╝
+        """.format
+
+
+class TradeStore:
+    """Column store for closed trades
+    
+    profit and close time live in NumPy arrays (grown by doubling) so the
+    stats are plain array reductions. The profit column is float64; a copy
+    of each trade dict is kept alongside, so records come back with their
+    original values (an int profit stays an int). int_profit marks the rows
+    whose profit was an int, so a window of int profits still totals to an int.
+    """
+    
+    def __init__(self, capacity: int = 64):
+        self.symbol: List[Optional[str]] = []
+        self.type: List[Optional[str]] = []
+        self.close_time: List[Optional[str]] = []
+        self._records: List[Dict] = []
+        self._profit = np.empty(capacity, dtype=np.float64)
+        self._close_ts = np.empty(capacity, dtype=np.float64)
+        self._int_profit = np.empty(capacity, dtype=np.bool_)
+        self._size = 0
+    
+    @classmethod
+    def from_records(cls, trades: List[Dict]) -> "TradeStore":
+        """Build a store from a list of trade dicts"""
+        store = cls(capacity=max(64, len(trades)))
+        for trade in trades:
+            store.append(trade)
+        return store
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @property
+    def profit(self) -> np.ndarray:
+        """Profit per trade"""
+        return self._profit[:self._size]
+    
+    @property
+    def close_ts(self) -> np.ndarray:
+        """Close times as epoch seconds"""
+        return self._close_ts[:self._size]
+    
+    @property
+    def int_profit(self) -> np.ndarray:
+        """True where the trade's profit was added as an int"""
+        return self._int_profit[:self._size]
+    
+    def append(self, trade: Dict):
+        """Add one trade"""
+        if self._size == len(self._profit):
+            self._profit = np.resize(self._profit, 2 * self._size)
+            self._close_ts = np.resize(self._close_ts, 2 * self._size)
+            self._int_profit = np.resize(self._int_profit, 2 * self._size)
+        
+        close_time = trade.get('close_time')
+        profit = trade.get('profit', 0)
+        self._profit[self._size] = profit
+        self._close_ts[self._size] = datetime.fromisoformat(close_time or '2020-01-01').timestamp()
+        self._int_profit[self._size] = isinstance(profit, int)
+        self._size += 1
+        
+        self.symbol.append(trade.get('symbol'))
+        self.type.append(trade.get('type'))
+        self.close_time.append(close_time)
+        self._records.append(dict(trade))
+    
+    def profit_value(self, i: int):
+        """Profit of trade i as it was added (int or float)"""
+        return self._records[i].get('profit', 0)
+    
+    def record(self, i: int) -> Dict:
+        """Trade i as a dict (a copy of the one added)"""
+        return dict(self._records[i])
+    
+    def records(self) -> List[Dict]:
+        """All trades as dicts (copies of the ones added)"""
+        return [dict(trade) for trade in self._records]
+    
+    def views(self) -> Tuple[Mapping, ...]:
+        """All trades as read-only views of the stored dicts"""
+        return tuple(MappingProxyType(trade) for trade in self._records)
 
 
 class PerformanceMonitor:
     """Monitor and analyze trading performance"""
     
-    def __init__(self):
-        self.trades: List[Dict] = []
+    def __init__(self, journal: Optional[str] = None):
+        self._store = TradeStore()
         self.equity_curve: List[float] = []
+        # JSON Lines file each new trade is appended to (None = memory only)
+        self._jsonl_path = journal
+        self._journal = None
+    
+    @property
+    def trades(self) -> Tuple[Mapping, ...]:
+        """Trade history as a tuple of read-only trade mappings
+        
+        Changing it (trades.append, trades[0]['profit'] = ...) raises; use
+        add_trade, or assign a whole list to trades. dict(trade) gives an
+        editable copy.
+        """
+        return self._store.views()
+    
+    @trades.setter
+    def trades(self, trades: List[Dict]):
+        self._store = TradeStore.from_records(trades)
         
     def add_trade(self, trade: Dict):
         """Add a completed trade to the record"""
-        self.trades.append(trade)
+        self._store.append(trade)
+        
+        if self._jsonl_path:
+            if self._journal is None:
+                Path(self._jsonl_path).parent.mkdir(parents=True, exist_ok=True)
+                self._journal = open(self._jsonl_path, 'a', buffering=1)
+            self._journal.write(json.dumps(trade, separators=(",", ":")) + "\n")
+    
+    def close(self):
+        """Close the trade journal"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
         
     def get_stats(self, days: int = 30) -> Dict[str, Any]:
         """Get performance statistics"""
-        if not self.trades:
+        if not len(self._store):
             return {
                 "total_trades": 0,
                 "win_rate": 0,
@@ -32,60 +162,67 @@ class PerformanceMonitor:
             }
         
         # Filter by date
-        cutoff = datetime.now() - timedelta(days=days)
-        recent_trades = [
-            t for t in self.trades 
-            if datetime.fromisoformat(t.get('close_time', '2020-01-01')) > cutoff
-        ]
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+        index = np.flatnonzero(self._store.close_ts > cutoff)
+        recent = self._store.profit[index]
         
-        wins = sum(1 for t in recent_trades if t.get('profit', 0) > 0)
-        total = len(recent_trades)
+        total = len(recent)
+        wins = int((recent > 0).sum())
+        # Same number type as summing the original profits in the window
+        all_int = self._store.int_profit[index].all()
+        total_profit = (int if all_int else float)(recent.sum())
         
         return {
             "total_trades": total,
             "winning_trades": wins,
             "losing_trades": total - wins,
             "win_rate": (wins / total * 100) if total > 0 else 0,
-            "total_profit": sum(t.get('profit', 0) for t in recent_trades),
-            "avg_profit": sum(t.get('profit', 0) for t in recent_trades) / total if total > 0 else 0,
-            "best_trade": max((t.get('profit', 0) for t in recent_trades), default=0),
-            "worst_trade": min((t.get('profit', 0) for t in recent_trades), default=0),
+            "total_profit": total_profit,
+            "avg_profit": total_profit / total if total > 0 else 0,
+            "best_trade": self._store.profit_value(index[recent.argmax()]) if total > 0 else 0,
+            "worst_trade": self._store.profit_value(index[recent.argmin()]) if total > 0 else 0,
         }
     
     def generate_report(self, days: int = 30):
         """Generate a performance report"""
         stats = self.get_stats(days)
         
-        report = f"""
-╔═══════════════════════════════════════════════════════════╗
-║            PERFORMANCE REPORT - Last {days} Days                ║
-╠═══════════════════════════════════════════════════════════╣
-║  Total Trades:     {stats['total_trades']:<35}║
-║  Winning Trades:   {stats['winning_trades']:<35}║
-║  Losing Trades:   {stats['losing_trades']:<35}║
-║  Win Rate:        {stats['win_rate']:.1f}%{' '*32}║
-╠═══════════════════════════════════════════════════════════╣
-║  Total Profit:    ${stats['total_profit']:<34}║
-║  Average Profit:  ${stats['avg_profit']:<34}║
-║  Best Trade:      ${stats['best_trade']:<34}║
-║  Worst Trade:     ${stats['worst_trade']:<34}║
-╚═══════════════════════════════════════════════════════════╝
-        """
+        report = _REPORT_TEMPLATE(days=days, **stats)
         
         print(report)
         return stats
     
-    def save_to_file(self, filename: str = "reports/performance.json"):
-        """Save trade history to file"""
-        Path(filename).parent.mkdir(exist_ok=True)
+    def save_to_file(self, filename: str = "reports/performance.jsonl"):
+        """Write the full trade history as JSON Lines (compacts the journal)"""
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        
+        if self._jsonl_path and Path(self._jsonl_path) == Path(filename):
+            self.close()
         
         with open(filename, 'w') as f:
-            json.dump(self.trades, f, indent=2)
+            for trade in self._store.records():
+                f.write(json.dumps(trade, separators=(",", ":")) + "\n")
         
         print(f"Performance data saved to {filename}")
     
-    def load_from_file(self, filename: str = "reports/performance.json"):
-        """Load trade history from file"""
-        if Path(filename).exists():
-            with open(filename, 'r') as f:
+    def load_from_file(self, filename: str = "reports/performance.jsonl"):
+        """Load trade history from a JSON Lines file (or a legacy JSON array)
+        
+        When filename is missing but a history saved under the old default
+        name (the same path ending in .json) exists, that one is loaded and
+        written out as filename; the old file is left in place.
+        """
+        path = Path(filename)
+        legacy = path.with_suffix('.json')
+        if not path.exists() and path.suffix == '.jsonl' and legacy.exists():
+            with open(legacy, 'r') as f:
                 self.trades = json.load(f)
+            self.save_to_file(filename)
+        elif path.exists():
+            with open(filename, 'r') as f:
+                if f.read(1) == '[':
+                    f.seek(0)
+                    self.trades = json.load(f)
+                else:
+                    f.seek(0)
+                    self.trades = [json.loads(line) for line in f if line.strip()]
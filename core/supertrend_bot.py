@@ -4,18 +4,32 @@ SuperTrend-based trading bot with machine learning optimization
 """
 
 import MetaTrader5 as mt5
-import pandas as pd
 import numpy as np
 from datetime import datetime
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
 
+from core._kernels import _rolling_mean, _supertrend_core, _supertrend_into, _supertrend_step
+from core._types import Bars, SymbolScratch
+
 logger = logging.getLogger(__name__)
 
+# Bar length per MT5 timeframe, for waking up right after a bar opens
+_TIMEFRAME_SECONDS = {
+    mt5.TIMEFRAME_M1: 60,
+    mt5.TIMEFRAME_M5: 300,
+    mt5.TIMEFRAME_M15: 900,
+    mt5.TIMEFRAME_M30: 1800,
+    mt5.TIMEFRAME_H1: 3600,
+    mt5.TIMEFRAME_H4: 14400,
+    mt5.TIMEFRAME_D1: 86400,
+}
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Bot configuration"""
     symbol: str = "EURUSD"
@@ -45,104 +59,151 @@ class SuperTrendBot:
         self.dry_run = False
         self.positions: List[Dict] = []
         self.best_factor = (config.min_factor + config.max_factor) / 2
+        # (bar time, (supertrend, direction, atr)) of the last closed bar
+        self._state: Optional[tuple] = None
+        # Bars needed to step SuperTrend and the volume MA once warm
+        self._warm_bars = max(config.atr_period + 3, config.volume_ma_period)
+        # Output buffers reused by the full recalculation
+        self._scratch = SymbolScratch.allocate()
+        self._bar_seconds = _TIMEFRAME_SECONDS.get(config.timeframe)
+        # Worker threads for sending several SL/TP modifications at once
+        self._pool = ThreadPoolExecutor(max_workers=max(1, config.max_positions))
+        
+    def calculate_supertrend(self, bars: Bars, out: Optional[SymbolScratch] = None) -> Dict[str, np.ndarray]:
+        """Calculate SuperTrend indicator
+        
+        With out given, results are views into its buffers and are only
+        valid until the buffers are reused.
+        """
+        # TR, ATR, bands and direction in one compiled pass
+        if out is None:
+            supertrend, direction, atr = _supertrend_core(
+                bars.high, bars.low, bars.close, self.config.atr_period, self.best_factor
+            )
+        else:
+            n = len(bars)
+            supertrend, direction, atr = out.supertrend[:n], out.direction[:n], out.atr[:n]
+            _supertrend_into(
+                bars.high, bars.low, bars.close, self.config.atr_period, self.best_factor,
+                out.tr[:n], supertrend, direction, atr
+            )
         
-    def calculate_supertrend(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate SuperTrend indicator"""
-        high = df['high']
-        low = df['low']
-        close = df['close']
-        
-        # ATR calculation
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(self.config.atr_period).mean()
-        
-        # SuperTrend calculation
-        hl_avg = (high + low) / 2
-        upper_band = hl_avg + (self.best_factor * atr)
-        lower_band = hl_avg - (self.best_factor * atr)
-        
-        # Direction
-        direction = pd.Series(1, index=df.index)
-        
-        for i in range(self.config.atr_period, len(df)):
-            if close.iloc[i] > upper_band.iloc[i-1]:
-                direction.iloc[i] = 1
-            elif close.iloc[i] < lower_band.iloc[i-1]:
-                direction.iloc[i] = -1
-            else:
-                direction.iloc[i] = direction.iloc[i-1]
-        
-        df['supertrend'] = lower_band.where(direction == 1, upper_band)
-        df['direction'] = direction
-        df['atr'] = atr
-        
-        return df
+        return {'supertrend': supertrend, 'direction': direction, 'atr': atr}
     
-    def calculate_volume_ma(self, df: pd.DataFrame) -> pd.DataFrame:
+    def calculate_supertrend_incremental(self, bars: Bars) -> Optional[Dict[str, np.ndarray]]:
+        """Step SuperTrend over the newest bars and return the last two values
+        
+        The last bar is the one still forming, so state is committed for the
+        bar before it. Returns None when there is no state yet or the bar
+        times do not line up; the caller then runs calculate_supertrend().
+        """
+        n = len(bars)
+        if self._state is None or n < self.config.atr_period + 3:
+            return None
+        
+        bar_time, previous = self._state
+        
+        if bars.time[-3] == bar_time:
+            # One bar closed since the last call
+            previous = self._step(bars, n - 2, previous[1])
+            self._state = (bars.time[-2], previous)
+        elif bars.time[-2] != bar_time:
+            return None
+        
+        current = self._step(bars, n - 1, previous[1])
+        return {
+            'supertrend': np.array([previous[0], current[0]]),
+            'direction': np.array([previous[1], current[1]], dtype=np.int8),
+            'atr': np.array([previous[2], current[2]]),
+        }
+    
+    def _step(self, bars: Bars, i: int, prev_direction: int) -> tuple:
+        """Advance the SuperTrend recurrence by one bar"""
+        supertrend, direction, atr = _supertrend_step(
+            bars.high, bars.low, bars.close, i, self.config.atr_period, self.best_factor, prev_direction
+        )
+        return supertrend, int(direction), atr
+    
+    def calculate_volume_ma(self, bars: Bars) -> np.ndarray:
         """Calculate Volume Moving Average"""
-        df['volume_ma'] = df['tick_volume'].rolling(self.config.volume_ma_period).mean()
-        return df
+        return _rolling_mean(bars.volume.astype(np.float64), self.config.volume_ma_period)
     
-    def get_data(self, bars: int = 100) -> Optional[pd.DataFrame]:
-        """Get price data"""
+    def get_data(self, bars: int = 100) -> Optional[Bars]:
+        """Get price data as column arrays over the MT5 rates
+        
+        Use Bars.to_dataframe() where a DataFrame is actually needed.
+        """
         rates = mt5.copy_rates_from_pos(self.config.symbol, self.config.timeframe, 0, bars)
         if rates is None:
             return None
         
-        df = pd.DataFrame(rates)
-        df['time'] = pd.to_datetime(df['time'], unit='s')
-        
-        return df
+        return Bars.from_rates(rates)
     
     def analyze(self) -> Dict[str, Any]:
         """Analyze market and generate signal"""
-        df = self.get_data()
-        if df is None or len(df) < 50:
-            return {"signal": "none", "strength": 0}
+        # Once warm only the bars the step and the volume MA need are fetched
+        st = None
+        if self._state is not None:
+            bars = self.get_data(self._warm_bars)
+            if bars is not None and len(bars) >= self._warm_bars:
+                st = self.calculate_supertrend_incremental(bars)
         
-        # Calculate indicators
-        df = self.calculate_supertrend(df)
-        df = self.calculate_volume_ma(df)
+        if st is None:
+            bars = self.get_data()
+            if bars is None or len(bars) < 50:
+                return {"signal": "none", "strength": 0}
+            
+            self._scratch = self._scratch.fit(len(bars))
+            result = self.calculate_supertrend(bars, out=self._scratch)
+            st = {name: values[-2:].copy() for name, values in result.items()}
+            self._state = (bars.time[-2], (
+                st['supertrend'][0], int(st['direction'][0]), st['atr'][0]
+            ))
         
-        current = df.iloc[-1]
-        previous = df.iloc[-2]
+        # Calculate indicators
+        close = bars.close
+        volume = bars.volume
+        volume_ma = self.calculate_volume_ma(bars)
+        previous_direction = st['direction'][0]
+        current_direction = st['direction'][1]
         
         # Signal detection
         signal = "none"
         strength = 0
         
         # Volume check
-        volume_ok = current['tick_volume'] > (current['volume_ma'] * self.config.volume_multiplier)
+        volume_ok = volume[-1] > (volume_ma[-1] * self.config.volume_multiplier)
         
         # SuperTrend crossover
-        if previous['direction'] == -1 and current['direction'] == 1 and volume_ok:
+        if previous_direction == -1 and current_direction == 1 and volume_ok:
             signal = "buy"
             strength = 70
-        elif previous['direction'] == 1 and current['direction'] == -1 and volume_ok:
+        elif previous_direction == 1 and current_direction == -1 and volume_ok:
             signal = "sell"
             strength = 70
         
         return {
             "signal": signal,
             "strength": strength,
-            "price": current['close'],
-            "supertrend": current['supertrend'],
-            "atr": current['atr'],
-            "direction": current['direction']
+            "price": close[-1],
+            "supertrend": st['supertrend'][1],
+            "atr": st['atr'][1],
+            "direction": current_direction
         }
     
-    def calculate_lot_size(self, stop_loss_pips: float) -> float:
-        """Calculate lot size based on risk"""
+    def calculate_lot_size(self, stop_loss_pips: float, symbol_info=None) -> float:
+        """Calculate lot size based on risk
+        
+        symbol_info can be passed in by a caller that already fetched it.
+        """
         account_info = mt5.account_info()
         if account_info is None:
             return 0.01
         
         risk_amount = account_info.balance * (self.config.risk_percent / 100)
         
-        symbol_info = mt5.symbol_info(self.config.symbol)
+        if symbol_info is None:
+            symbol_info = mt5.symbol_info(self.config.symbol)
         if symbol_info is None:
             return 0.01
         
@@ -157,29 +218,34 @@ class SuperTrendBot:
             logger.info(f"[DRY RUN] Would place {order_type} order")
             return True
         
-        symbol_info = mt5.symbol_info(self.config.symbol)
+        config = self.config
+        symbol = config.symbol
+        symbol_info = mt5.symbol_info(symbol)
         if symbol_info is None:
             return False
         
-        tick = mt5.symbol_info_tick(self.config.symbol)
+        tick = mt5.symbol_info_tick(symbol)
         point = symbol_info.point
+        sl_pips = config.sl_multiplier * config.atr_period
+        sl_distance = sl_pips * point
+        tp_distance = config.tp_multiplier * config.atr_period * point
         
         if order_type == "buy":
             price = tick.ask
-            sl = price - (self.config.sl_multiplier * self.config.atr_period * point)
-            tp = price + (self.config.tp_multiplier * self.config.atr_period * point)
+            sl = price - sl_distance
+            tp = price + tp_distance
             order_type_enum = mt5.ORDER_TYPE_BUY
         else:
             price = tick.bid
-            sl = price + (self.config.sl_multiplier * self.config.atr_period * point)
-            tp = price - (self.config.tp_multiplier * self.config.atr_period * point)
+            sl = price + sl_distance
+            tp = price - tp_distance
             order_type_enum = mt5.ORDER_TYPE_SELL
         
-        lot_size = self.calculate_lot_size(self.config.sl_multiplier * self.config.atr_period)
+        lot_size = self.calculate_lot_size(sl_pips, symbol_info)
         
         request = {
             "action": mt5.TRADE_ACTION_DEAL,
-            "symbol": self.config.symbol,
+            "symbol": symbol,
             "volume": lot_size,
             "type": order_type_enum,
             "price": price,
@@ -195,7 +261,7 @@ class SuperTrendBot:
         result = mt5.order_send(request)
         
         if result.retcode == mt5.TRADE_RETCODE_DONE:
-            logger.info(f"Order placed: {order_type} {lot_size} {self.config.symbol}")
+            logger.info(f"Order placed: {order_type} {lot_size} {symbol}")
             return True
         
         logger.error(f"Order failed: {result.comment}")
@@ -214,6 +280,7 @@ class SuperTrendBot:
                 "volume": p.volume,
                 "profit": p.profit,
                 "open_price": p.price_open,
+                "sl": p.sl,
             }
             for p in positions
         ]
@@ -227,21 +294,59 @@ class SuperTrendBot:
         if not positions:
             return
         
+        # One tick and one symbol lookup for all positions
+        symbol = self.config.symbol
+        tick = mt5.symbol_info_tick(symbol)
+        symbol_info = mt5.symbol_info(symbol)
+        if tick is None or symbol_info is None:
+            return
+        point = symbol_info.point
+        atr_period = self.config.atr_period
+        activation_pips = self.config.trail_activation * atr_period
+        trail_offset = 0.5 * atr_period * point
+        bid, ask = tick.bid, tick.ask
+        
+        requests = []
         for pos in positions:
-            current_price = mt5.symbol_info_tick(self.config.symbol).bid if pos['type'] == 'buy' else mt5.symbol_info_tick(self.config.symbol).ask
-            pnl_pips = (current_price - pos['open_price']) / mt5.symbol_info(self.config.symbol).point
+            is_buy = pos['type'] == 'buy'
+            open_price = pos['open_price']
+            pnl_pips = ((bid if is_buy else ask) - open_price) / point
             
-            if pnl_pips >= self.config.trail_activation * self.config.atr_period:
+            if pnl_pips >= activation_pips:
                 # Update trailing stop
-                new_sl = pos['open_price'] + (0.5 * self.config.atr_period * mt5.symbol_info(self.config.symbol).point) if pos['type'] == 'buy' else pos['open_price'] - (0.5 * self.config.atr_period * mt5.symbol_info(self.config.symbol).point)
+                new_sl = open_price + trail_offset if is_buy else open_price - trail_offset
+                if abs(pos['sl'] - new_sl) < point / 2:
+                    continue  # already at this stop
                 
-                request = {
+                requests.append({
                     "action": mt5.TRADE_ACTION_SLTP,
-                    "symbol": self.config.symbol,
+                    "symbol": symbol,
                     "position": pos['ticket'],
                     "sl": new_sl,
-                }
-                mt5.order_send(request)
+                })
+        
+        # Send the modifications concurrently so the round-trips overlap
+        if len(requests) == 1:
+            mt5.order_send(requests[0])
+        elif requests:
+            list(self._pool.map(mt5.order_send, requests))
+    
+    def _sleep_seconds(self, interval_seconds: int) -> float:
+        """Time until the next poll
+        
+        Wakes one second after the next bar opens (by server time) when that
+        comes sooner than interval_seconds, which stays the ceiling so open
+        positions are still managed within the bar.
+        """
+        if self._bar_seconds is None:
+            return interval_seconds
+        
+        tick = mt5.symbol_info_tick(self.config.symbol)
+        if tick is None:
+            return interval_seconds
+        
+        until_next_bar = self._bar_seconds - tick.time % self._bar_seconds + 1
+        return max(1, min(interval_seconds, until_next_bar))
     
     def run(self, interval_seconds: int = 30):
         """Run the trading bot"""
@@ -265,7 +370,7 @@ class SuperTrendBot:
                 # Manage trailing stops
                 self.manage_trailing_stop()
                 
-                time.sleep(interval_seconds)
+                time.sleep(self._sleep_seconds(interval_seconds))
                 
             except Exception as e:
                 logger.error(f"Error in trading loop: {e}")
@@ -10,6 +10,8 @@
 
 # Auto-detect MT5 path (common Windows locations)
 import os
+from types import MappingProxyType
+from typing import NamedTuple
 
 # Load .env so credentials can be set without editing this file
 try:
@@ -18,6 +20,9 @@ try:
 except ImportError:
     pass
 
+# Environment read once, after .env has been applied
+_env = os.environ.copy()
+
 def get_mt5_path():
     """Auto-detect MT5 terminal path"""
     common_paths = [
@@ -40,26 +45,27 @@ MT5_CONFIG = {
 
 # Demo Account: from env (MT5_LOGIN, MT5_PASSWORD, MT5_SERVER) or defaults below
 def _int_env(name, default=0):
-    v = os.getenv(name)
-    if v is None or v == "":
+    v = _env.get(name, "")
+    if v == "":
         return default
     try:
         return int(v)
     except ValueError:
         return default
 
-MT5_DEMO = {
+# Read-only views: callers take a .copy() before overriding fields
+MT5_DEMO = MappingProxyType({
     "login": _int_env("MT5_LOGIN", 10008260595),
-    "password": os.getenv("MT5_PASSWORD", ""),
-    "server": os.getenv("MT5_SERVER", "MetaQuotes-Demo"),
-}
+    "password": _env.get("MT5_PASSWORD", ""),
+    "server": _env.get("MT5_SERVER", "MetaQuotes-Demo"),
+})
 
 # Real Account: from env (MT5_REAL_LOGIN, MT5_REAL_PASSWORD, MT5_REAL_SERVER) or defaults
-MT5_REAL = {
+MT5_REAL = MappingProxyType({
     "login": _int_env("MT5_REAL_LOGIN", 0),
-    "password": os.getenv("MT5_REAL_PASSWORD", ""),
-    "server": os.getenv("MT5_REAL_SERVER", ""),
-}
+    "password": _env.get("MT5_REAL_PASSWORD", ""),
+    "server": _env.get("MT5_REAL_SERVER", ""),
+})
 
 # ============================================
 # TRADING CONFIGURATION
@@ -79,7 +85,13 @@ TRADING_CONFIG = {
 }
 
 # Trading Symbols
-SYMBOLS = {
+class SymbolParams(NamedTuple):
+    """Per-symbol trading limits"""
+    spread_max: int
+    min_lot: float
+    point: float
+
+_SYMBOLS_RAW = {
     "EURUSD": {"spread_max": 20, "min_lot": 0.01, "point": 0.00001},
     "GBPUSD": {"spread_max": 30, "min_lot": 0.01, "point": 0.00001},
     "USDJPY": {"spread_max": 20, "min_lot": 0.01, "point": 0.0001},
@@ -92,6 +104,11 @@ SYMBOLS = {
     "GBPJPY": {"spread_max": 40, "min_lot": 0.01, "point": 0.0001},
 }
 
+# Fixed-shape records per symbol: SYMBOLS["EURUSD"].point, or unpack the tuple
+SYMBOLS = MappingProxyType({
+    name: SymbolParams(**params) for name, params in _SYMBOLS_RAW.items()
+})
+
 # ============================================
 # SMART RISK MANAGEMENT
 # ============================================
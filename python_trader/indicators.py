@@ -0,0 +1,24 @@
+"""
+Indicator kernels for the Smart Edition bot
+Last-bar RSI / Bollinger values from the window tail, plus an EMA / MACD
+state that can be advanced bar by bar; ahead-of-time built or JIT-compiled
+"""
+
+import numpy as np
+
+
+# Order of the values in an EMA state array
+EMA_FIELDS = ("ema_9", "ema_21", "ema_50", "ema_12", "ema_26", "macd_signal")
+
+
+def ema_seed(first_close: float) -> np.ndarray:
+    """EMA state at the first bar: every EMA at the close, MACD signal at 0"""
+    return np.array([first_close] * 5 + [0.0])
+
+
+# The JIT module compiles both kernels on import, so try the AOT build
+# (python indicators_aot.py) first
+try:
+    from _indicator_kernels import ema_advance, window_indicators
+except ImportError:
+    from indicators_jit import ema_advance, window_indicators
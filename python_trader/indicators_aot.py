@@ -0,0 +1,30 @@
+"""
+Ahead-of-time build of the indicator kernels
+Run `python indicators_aot.py` from this directory once per install to skip
+JIT at startup. The built functions do not check argument types the way the
+JIT does, so they must only be given contiguous float64 arrays.
+"""
+
+import os
+
+from numba.pycc import CC
+
+# Always built from the @njit definitions, even if an older build is present
+import indicators_jit
+
+cc = CC('_indicator_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Same signatures as the @njit declarations in indicators_jit.py
+EXPORTS = {
+    'ema_advance': 'void(f8[:], f8[:])',
+    'window_indicators': 'UniTuple(f8, 3)(f8[:])',
+}
+
+for name, signature in EXPORTS.items():
+    cc.export(name, signature)(getattr(indicators_jit, name).py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built {cc.name} in {cc.output_dir}")
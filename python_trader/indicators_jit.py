@@ -0,0 +1,77 @@
+"""
+Indicator kernels for the Smart Edition bot, JIT versions
+Compiled with Numba when installed. Importing this module compiles them,
+so indicators.py only does so when there is no ahead-of-time build.
+"""
+
+import numpy as np
+
+from _njit import njit
+
+
+@njit('void(f8[:], f8[:])', cache=True, fastmath={'contract'})
+def ema_advance(ema, close):
+    """Step an EMA state in place over the given closes
+
+    EMAs use adjust=False smoothing (alpha = 2 / (span + 1)) and the MACD
+    signal is a 9-span EMA of ema_12 - ema_26.
+    """
+    a9 = 2 / 10
+    a21 = 2 / 22
+    a50 = 2 / 51
+    a12 = 2 / 13
+    a26 = 2 / 27
+    ema_9, ema_21, ema_50, ema_12, ema_26, macd_signal = ema[0], ema[1], ema[2], ema[3], ema[4], ema[5]
+    for i in range(close.shape[0]):
+        x = close[i]
+        ema_9 = (1 - a9) * ema_9 + a9 * x
+        ema_21 = (1 - a21) * ema_21 + a21 * x
+        ema_50 = (1 - a50) * ema_50 + a50 * x
+        ema_12 = (1 - a12) * ema_12 + a12 * x
+        ema_26 = (1 - a26) * ema_26 + a26 * x
+        macd_signal = (1 - a9) * macd_signal + a9 * (ema_12 - ema_26)
+    ema[0] = ema_9
+    ema[1] = ema_21
+    ema[2] = ema_50
+    ema[3] = ema_12
+    ema[4] = ema_26
+    ema[5] = macd_signal
+
+
+@njit('UniTuple(f8, 3)(f8[:])', cache=True, fastmath={'contract'})
+def window_indicators(close):
+    """(rsi, bb_upper, bb_lower) for the last bar, from the tail of close only
+
+    RSI uses 14-bar simple means of gains and losses (NaN when there is no
+    movement), Bollinger bands the 20-bar mean and sample std. Needs at
+    least 20 closes. Only FMA contraction is enabled because RSI can be NaN.
+    """
+    n = close.shape[0]
+
+    # RSI over the last 14 deltas
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - 14, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gain += delta
+        elif delta < 0:
+            loss -= delta
+    if loss > 0:
+        rsi = 100 - (100 / (1 + (gain / 14) / (loss / 14)))
+    elif gain > 0:
+        rsi = 100.0
+    else:
+        rsi = np.nan
+
+    # Bollinger bands over the last 20 closes
+    total = 0.0
+    for i in range(n - 20, n):
+        total += close[i]
+    sma_20 = total / 20
+    var = 0.0
+    for i in range(n - 20, n):
+        var += (close[i] - sma_20) ** 2
+    std_20 = np.sqrt(var / 19)
+
+    return rsi, sma_20 + std_20 * 2, sma_20 - std_20 * 2
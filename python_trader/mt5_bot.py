@@ -3,41 +3,140 @@ MetaTrader 5 Python Trading Bot - Smart Edition
 Advanced auto-trading with real-time analysis, risk management, and news filtering
 """
 
+import os
 import MetaTrader5 as mt5
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import time
 import json
 import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from config import MT5_DEMO, MT5_REAL, MT5_CONFIG, TRADING_CONFIG, SYMBOLS, RISK_CONFIG, STRATEGY_CONFIG, NEWS_CONFIG
+from indicators import ema_advance, ema_seed, window_indicators
+
+
+# MT5 timeframe constants by name
+_TIMEFRAMES = {
+    "M1": mt5.TIMEFRAME_M1,
+    "M5": mt5.TIMEFRAME_M5,
+    "M15": mt5.TIMEFRAME_M15,
+    "M30": mt5.TIMEFRAME_M30,
+    "H1": mt5.TIMEFRAME_H1,
+    "H4": mt5.TIMEFRAME_H4,
+    "D1": mt5.TIMEFRAME_D1,
+}
+
+
+def _next_midnight(day) -> float:
+    """Epoch seconds of the local midnight that ends day"""
+    return datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
+
+
+class _PipTable(dict):
+    """symbol -> (pip value per lot, pip size, points per pip), filled on first use"""
+    
+    def __missing__(self, symbol: str) -> tuple:
+        if "JPY" in symbol:
+            pips = (1000, 0.01, 10)
+        elif symbol == "XAUUSD":
+            pips = (100, 1.0, 1)
+        else:
+            pips = (10, 0.0001, 10)
+        self[symbol] = pips
+        return pips
+
+
+_PIPS = _PipTable()
+
 
 class NewsManager:
     """Manages news events and filters trading around them"""
     
+    # Calendar fetched within this many seconds (even by a previous run) is reused
+    CACHE_TTL = 1800
+    # After a failed fetch a cached calendar is still used up to this age
+    CACHE_MAX_STALE = 86400
+    CACHE_FILE = Path(__file__).resolve().parent / "cache" / "news_calendar.json"
+    
     def __init__(self):
         self.news_events = []
         self.last_fetch = None
         self.fetch_interval = 300  # 5 minutes
+        # True while serving a cached calendar because the last fetch failed
+        self.stale = False
+        # One pooled connection for all fetches (requests already asks for gzip);
+        # connection errors and 5xx replies get two quick retries
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = "meta-bot/1.0"
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504), allowed_methods=("GET",))
+        self._session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry))
+        self._cache = None  # (fetched_at epoch, events, Last-Modified), loaded from disk on first use
+        self._fetch_thread: Optional[threading.Thread] = None
     
     def fetch_calendar(self) -> List[dict]:
         """Fetch forex calendar from Forex Factory"""
         if not NEWS_CONFIG.get("use_forexfactory", True):
             return []
         
+        cached = self._load_cache()
+        if cached and time.time() - cached[0] < self.CACHE_TTL:
+            self.stale = False
+            return cached[1]
+        
         try:
-            url = "https://www.forexfactory.com/api/calendar"
-            response = requests.get(url, timeout=10)
+            url = NEWS_CONFIG.get("calendar_url", "https://www.forexfactory.com/api/calendar")
+            # Let the server answer 304 when the cached calendar is still current
+            headers = {"If-Modified-Since": cached[2]} if cached and cached[2] else None
+            response = self._session.get(url, timeout=10, headers=headers)
+            if response.status_code == 304 and cached:
+                self._save_cache(cached[1], cached[2])
+                self.stale = False
+                return cached[1]
             if response.status_code == 200:
                 data = response.json()
-                return data.get("calendar", [])
+                events = data.get("calendar", [])
+                self._save_cache(events, response.headers.get("Last-Modified"))
+                self.stale = False
+                return events
         except Exception as e:
             print(f"News fetch error: {e}")
         
+        if cached and time.time() - cached[0] < self.CACHE_MAX_STALE:
+            print("⚠️ News fetch failed - using cached calendar")
+            self.stale = True
+            return cached[1]
+        
         return []
     
+    def _load_cache(self) -> Optional[tuple]:
+        """Last fetched calendar from memory, or from disk after a restart"""
+        if self._cache is None:
+            try:
+                with open(self.CACHE_FILE, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._cache = (float(data["fetched_at"]), data["events"], data.get("last_modified"))
+            except (OSError, ValueError, KeyError, TypeError):
+                return None
+        return self._cache
+    
+    def _save_cache(self, events: List[dict], last_modified: Optional[str] = None):
+        """Remember the calendar in memory and on disk"""
+        self._cache = (time.time(), events, last_modified)
+        try:
+            self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.CACHE_FILE.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": self._cache[0], "events": events, "last_modified": last_modified}, f)
+            os.replace(tmp, self.CACHE_FILE)
+        except OSError as e:
+            print(f"News cache write error: {e}")
+    
     def should_trade(self, symbol: str = None) -> Tuple[bool, str]:
         """Check if it's safe to trade based on news"""
         now = datetime.now()
@@ -53,13 +152,24 @@ class NewsManager:
         return True, "OK"
     
     def update_news(self):
-        """Update news events periodically"""
+        """Update news events periodically
+        
+        The fetch runs in a background thread so a slow calendar endpoint
+        never stalls the trading loop; news_events is swapped in when done.
+        """
         now = datetime.now()
         if self.last_fetch and (now - self.last_fetch).total_seconds() < self.fetch_interval:
             return
+        if self._fetch_thread is not None and self._fetch_thread.is_alive():
+            return
         
-        self.news_events = self.fetch_calendar()
         self.last_fetch = now
+        self._fetch_thread = threading.Thread(target=self._refresh_news, daemon=True)
+        self._fetch_thread.start()
+    
+    def _refresh_news(self):
+        """Fetch the calendar and publish it"""
+        self.news_events = self.fetch_calendar()
 
 
 class AdaptiveStrategy:
@@ -72,48 +182,57 @@ class AdaptiveStrategy:
             "momentum": STRATEGY_CONFIG.get("momentum_weight", 25),
             "breakout": STRATEGY_CONFIG.get("breakout_weight", 25),
         }
-        self.trade_results = []
+        # Only the latest optimization window of results is kept
+        self.trade_results = deque(maxlen=STRATEGY_CONFIG.get("optimization_interval", 10))
+        # Which strategies vote is fixed for the session; only the weights adapt
+        self._trend_enabled = STRATEGY_CONFIG.get("trend_enabled", True)
+        self._mean_reversion_enabled = STRATEGY_CONFIG.get("mean_reversion_enabled", True)
+        self._momentum_enabled = STRATEGY_CONFIG.get("momentum_enabled", True)
+        self._min_confidence = STRATEGY_CONFIG.get("min_confidence", 50)
     
     def get_signal(self, indicators: dict, analysis: dict) -> Tuple[Optional[str], int, str]:
-        """Generate signal based on weighted strategies"""
-        signals = []
+        """Generate signal based on weighted strategies
         
-        if STRATEGY_CONFIG.get("trend_enabled", True):
-            if indicators.get("ema_9", 0) > indicators.get("ema_21", 0):
-                signals.append(("BUY", self.strategy_weights["trend"], "Trend UP"))
-            elif indicators.get("ema_9", 0) < indicators.get("ema_21", 0):
-                signals.append(("SELL", self.strategy_weights["trend"], "Trend DOWN"))
+        Each strategy votes +1 (BUY), -1 (SELL) or 0; reason strings are only
+        built once a signal clears min_confidence.
+        """
+        trend = reversion = momentum = 0
         
-        if STRATEGY_CONFIG.get("mean_reversion_enabled", True):
+        if self._trend_enabled:
+            ema_9 = indicators.get("ema_9", 0)
+            ema_21 = indicators.get("ema_21", 0)
+            trend = 1 if ema_9 > ema_21 else -1 if ema_9 < ema_21 else 0
+        
+        if self._mean_reversion_enabled:
             rsi = indicators.get("rsi", 50)
-            if rsi < 35:
-                signals.append(("BUY", self.strategy_weights["mean_reversion"], f"RSI oversold {rsi:.0f}"))
-            elif rsi > 65:
-                signals.append(("SELL", self.strategy_weights["mean_reversion"], f"RSI overbought {rsi:.0f}"))
+            reversion = 1 if rsi < 35 else -1 if rsi > 65 else 0
         
-        if STRATEGY_CONFIG.get("momentum_enabled", True):
+        if self._momentum_enabled:
             macd = indicators.get("macd", 0)
             macd_signal = indicators.get("macd_signal", 0)
-            if macd > macd_signal:
-                signals.append(("BUY", self.strategy_weights["momentum"], "MACD bullish"))
-            elif macd < macd_signal:
-                signals.append(("SELL", self.strategy_weights["momentum"], "MACD bearish"))
+            momentum = 1 if macd > macd_signal else -1 if macd < macd_signal else 0
         
-        buy_votes = sum(v for s, v, _ in signals if s == "BUY")
-        sell_votes = sum(v for s, v, _ in signals if s == "SELL")
+        weights = self.strategy_weights
+        buy_votes = ((weights["trend"] if trend > 0 else 0)
+                     + (weights["mean_reversion"] if reversion > 0 else 0)
+                     + (weights["momentum"] if momentum > 0 else 0))
+        sell_votes = ((weights["trend"] if trend < 0 else 0)
+                      + (weights["mean_reversion"] if reversion < 0 else 0)
+                      + (weights["momentum"] if momentum < 0 else 0))
         
         total = buy_votes + sell_votes
-        min_conf = STRATEGY_CONFIG.get("min_confidence", 50)
-        
-        if total >= min_conf:
-            if buy_votes > sell_votes:
-                conf = int((buy_votes / 100) * 100)
-                reasons = [r for s, v, r in signals if s == "BUY"]
-                return "BUY", conf, " | ".join(reasons[:2])
-            elif sell_votes > buy_votes:
-                conf = int((sell_votes / 100) * 100)
-                reasons = [r for s, v, r in signals if s == "SELL"]
-                return "SELL", conf, " | ".join(reasons[:2])
+        
+        if total >= self._min_confidence and buy_votes != sell_votes:
+            side = 1 if buy_votes > sell_votes else -1
+            votes = buy_votes if side > 0 else sell_votes
+            reasons = []
+            if trend == side:
+                reasons.append("Trend UP" if side > 0 else "Trend DOWN")
+            if reversion == side:
+                reasons.append(f"RSI oversold {rsi:.0f}" if side > 0 else f"RSI overbought {rsi:.0f}")
+            if momentum == side and len(reasons) < 2:
+                reasons.append("MACD bullish" if side > 0 else "MACD bearish")
+            return ("BUY" if side > 0 else "SELL"), int(votes), " | ".join(reasons)
         
         return None, 0, "No clear signal"
     
@@ -125,6 +244,11 @@ class AdaptiveStrategy:
 class MT5SmartTrader:
     """Smart MetaTrader 5 Trading Bot"""
     
+    # Bars fetched per analysis once a symbol's indicator state is warm
+    WARM_BARS = 30
+    # Seconds a get_prices() snapshot is served before re-querying MT5
+    PRICES_MAX_AGE = 1.0
+    
     def __init__(self):
         self.connected = False
         self.account_type = "demo"
@@ -146,7 +270,28 @@ class MT5SmartTrader:
             "current_risk_percent": TRADING_CONFIG.get("default_risk_percent", 1.0),
         }
         
+        # Epoch seconds of the next local midnight, when the daily stats roll over
+        self._next_reset = _next_midnight(self.stats["start_date"])
+        
         self.symbol_performance = {}
+        # symbol -> (bar time, EMA state) as of the last closed bar
+        self._ind_state: Dict[str, tuple] = {}
+        # Per-symbol analysis and batched closes run in these threads;
+        # order sends are only serialized per symbol
+        self._pool = ThreadPoolExecutor(max_workers=max(1, min(8, len(SYMBOLS))))
+        self._order_locks: Dict[str, threading.Lock] = {symbol: threading.Lock() for symbol in SYMBOLS}
+        # Opens and closes can now land in stats from several threads
+        self._stats_lock = threading.Lock()
+        # symbol -> point/digits/volume limits, which do not change while connected
+        self._symbol_static: Dict[str, dict] = {}
+        self._prices: Optional[tuple] = None  # (monotonic time, get_prices() result)
+        # Set by stop() so the loop's pause ends at once instead of running out
+        self._wake = threading.Event()
+        # Background loop started by start_background (checked and started under the lock)
+        self._loop_thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        # symbol -> (time, bid, ask) of the quote its last signal-less analysis saw
+        self._last_quote: Dict[str, tuple] = {}
     
     def connect(self, account_type: str = "demo", login: int = None, password: str = None, server: str = None) -> bool:
         """Connect to MT5 with provided credentials"""
@@ -228,12 +373,18 @@ class MT5SmartTrader:
         
         return True
     
+    def stop(self):
+        """Stop the trading loop, waking it if it is pausing"""
+        self.running = False
+        self._wake.set()
+    
     def disconnect(self):
         """Disconnect from MT5"""
-        self.running = False
+        self.stop()
         if self.connected:
             mt5.shutdown()
             self.connected = False
+        self._symbol_static.clear()
         print("🔌 Disconnected from MT5")
     
     def get_symbol_info(self, symbol: str) -> Optional[dict]:
@@ -246,94 +397,183 @@ class MT5SmartTrader:
             mt5.symbol_select(symbol, True)
             info = mt5.symbol_info(symbol)
         
+        static = self._symbol_static.get(symbol)
+        if static is None:
+            static = self._symbol_static[symbol] = {
+                "digits": info.digits,
+                "point": info.point,
+                "volume_min": info.volume_min,
+                "volume_max": info.volume_max,
+                "volume_step": info.volume_step,
+            }
+        
         return {
             "symbol": info.name,
             "bid": info.bid,
             "ask": info.ask,
             "spread": info.spread,
-            "digits": info.digits,
-            "point": info.point,
-            "volume_min": info.volume_min,
-            "volume_max": info.volume_max,
-            "volume_step": info.volume_step,
+            **static,
         }
     
-    def get_candles(self, symbol: str, timeframe: str = "M1", count: int = 100) -> pd.DataFrame:
-        """Get candle data for analysis"""
-        timeframe_map = {
-            "M1": mt5.TIMEFRAME_M1,
-            "M5": mt5.TIMEFRAME_M5,
-            "M15": mt5.TIMEFRAME_M15,
-            "M30": mt5.TIMEFRAME_M30,
-            "H1": mt5.TIMEFRAME_H1,
-            "H4": mt5.TIMEFRAME_H4,
-            "D1": mt5.TIMEFRAME_D1,
-        }
+    def get_symbol_static(self, symbol: str) -> Optional[dict]:
+        """Point, digits and volume limits for a symbol (queried once)"""
+        static = self._symbol_static.get(symbol)
+        if static is None and self.get_symbol_info(symbol):
+            static = self._symbol_static[symbol]
+        return static
+    
+    def get_prices(self) -> List[dict]:
+        """Bid/ask/spread for all configured symbols
+        
+        All symbols come from one symbols_get call (symbols hidden from
+        Market Watch go through get_symbol_info, which selects them). The
+        quotes are reused for PRICES_MAX_AGE seconds, so dashboards polling
+        together cost one round of MT5 calls.
+        """
+        cached = self._prices
+        if cached and time.monotonic() - cached[0] < self.PRICES_MAX_AGE:
+            return cached[1]
+        
+        snapshot = {info.name: info for info in mt5.symbols_get(group=",".join(SYMBOLS)) or ()}
+        
+        result = []
+        for symbol in SYMBOLS.keys():
+            info = snapshot.get(symbol)
+            if info is not None and info.visible:
+                bid, ask, spread = info.bid, info.ask, info.spread
+            else:
+                info = self.get_symbol_info(symbol)
+                if not info:
+                    continue
+                bid, ask, spread = info["bid"], info["ask"], info["spread"]
+            result.append({
+                "symbol": symbol,
+                "bid": bid,
+                "ask": ask,
+                "spread": spread,
+            })
+        self._prices = (time.monotonic(), result)
+        return result
+    
+    def _fresh_quotes(self, symbols: List[str], max_spread: float) -> Dict[str, Optional[tuple]]:
+        """(time, bid, ask) for the symbols whose quote moved since their last
+        signal-less analysis
+        
+        With no new tick the candles, and so the analysis, are unchanged.
+        Symbols whose spread is above max_spread are left out, since
+        open_trade would reject them anyway. One symbols_get call covers
+        all of them; symbols missing from it always count as fresh (with a
+        None quote).
+        """
+        if not symbols:
+            return {}
+        snapshot = {info.name: info for info in mt5.symbols_get(group=",".join(symbols)) or ()}
+        fresh = {}
+        for symbol in symbols:
+            info = snapshot.get(symbol)
+            if info is not None and info.spread > max_spread:
+                continue
+            quote = None if info is None else (info.time, info.bid, info.ask)
+            if quote is None or self._last_quote.get(symbol) != quote:
+                fresh[symbol] = quote
+        return fresh
+    
+    def get_candles(self, symbol: str, timeframe: str = "M1", count: int = 100) -> np.ndarray:
+        """Get candle data for analysis
         
-        mt5_tf = timeframe_map.get(timeframe, mt5.TIMEFRAME_M1)
+        Returns MT5's structured rates array as is (time in epoch seconds);
+        empty when no rates are available.
+        """
+        mt5_tf = _TIMEFRAMES.get(timeframe, mt5.TIMEFRAME_M1)
         rates = mt5.copy_rates_from_pos(symbol, mt5_tf, 0, count)
         
         if rates is None:
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(rates)
-        df['time'] = pd.to_datetime(df['time'], unit='s')
-        df['high'] = df['high']
-        df['low'] = df['low']
-        df['close'] = df['close']
+            return np.empty(0)
         
-        return df
+        return rates
     
-    def calculate_indicators(self, df: pd.DataFrame) -> dict:
-        """Calculate technical indicators"""
-        if len(df) < 26:
+    def calculate_indicators(self, rates: np.ndarray, symbol: str = None) -> dict:
+        """Calculate technical indicators
+        
+        With a symbol, the EMA/MACD state of its last closed bar is kept and
+        only advanced over bars that closed since the previous call; RSI and
+        Bollinger bands only ever look at the last 20 closes. If that state's
+        bar is no longer in rates the state is dropped and {} is returned, so the
+        caller can retry with a full window.
+        """
+        if len(rates) < 26:
             return {}
         
-        close = df['close']
-        high = df['high']
-        low = df['low']
-        
-        delta = close.diff()
-        gain = delta.where(delta > 0, 0).rolling(14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        close = np.ascontiguousarray(rates['close'], dtype=np.float64)
+        times = rates['time']
         
-        ema_9 = close.ewm(span=9, adjust=False).mean()
-        ema_21 = close.ewm(span=21, adjust=False).mean()
-        ema_50 = close.ewm(span=50, adjust=False).mean()
-        
-        ema_12 = close.ewm(span=12, adjust=False).mean()
-        ema_26 = close.ewm(span=26, adjust=False).mean()
-        macd = ema_12 - ema_26
-        macd_signal = macd.ewm(span=9, adjust=False).mean()
+        if symbol in self._ind_state:
+            ema = self._advance_ema_state(symbol, times, close)
+            if ema is None:
+                self._ind_state.pop(symbol, None)
+                return {}
+        else:
+            ema = ema_seed(close[0])
+            ema_advance(ema, close[1:-1])
+            if symbol:
+                self._ind_state[symbol] = (times[-2], ema)
         
-        sma_20 = close.rolling(20).mean()
-        std_20 = close.rolling(20).std()
-        bb_upper = sma_20 + (std_20 * 2)
-        bb_lower = sma_20 - (std_20 * 2)
+        # The last bar is still forming, so it is applied to a copy
+        current = ema.copy()
+        ema_advance(current, close[-1:])
+        ema_9, ema_21, ema_50, ema_12, ema_26, macd_signal = current
+        rsi, bb_upper, bb_lower = window_indicators(close)
         
         return {
-            "rsi": rsi.iloc[-1] if len(rsi) > 0 else 50,
-            "ema_9": ema_9.iloc[-1],
-            "ema_21": ema_21.iloc[-1],
-            "ema_50": ema_50.iloc[-1],
-            "macd": macd.iloc[-1] if len(macd) > 0 else 0,
-            "macd_signal": macd_signal.iloc[-1] if len(macd_signal) > 0 else 0,
-            "bb_upper": bb_upper.iloc[-1] if len(bb_upper) > 0 else 0,
-            "bb_lower": bb_lower.iloc[-1] if len(bb_lower) > 0 else 0,
-            "current_price": close.iloc[-1],
-            "high": high.iloc[-1],
-            "low": low.iloc[-1],
+            "rsi": rsi,
+            "ema_9": ema_9,
+            "ema_21": ema_21,
+            "ema_50": ema_50,
+            "macd": ema_12 - ema_26,
+            "macd_signal": macd_signal,
+            "bb_upper": bb_upper,
+            "bb_lower": bb_lower,
+            "current_price": close[-1],
+            "high": rates['high'][-1],
+            "low": rates['low'][-1],
         }
     
+    def _advance_ema_state(self, symbol: str, times: np.ndarray, close: np.ndarray) -> Optional[np.ndarray]:
+        """Bring the symbol's EMA state up to the last closed bar
+        
+        Returns None when the state's bar is no longer in the window.
+        """
+        state = self._ind_state.get(symbol)
+        if state is None:
+            return None
+        
+        bar_time, ema = state
+        i = int(np.searchsorted(times, bar_time))
+        if i >= len(times) - 1 or times[i] != bar_time:
+            return None
+        
+        if i < len(times) - 2:
+            # Advance a copy: an API request may be reading the same state
+            ema = ema.copy()
+            ema_advance(ema, close[i + 1:-1])
+            self._ind_state[symbol] = (times[-2], ema)
+        return ema
+    
     def analyze_market(self, symbol: str, require_stronger_signal: bool = False) -> dict:
         """Smart market analysis"""
-        df = self.get_candles(symbol, count=100)
-        if df.empty:
+        # Once a symbol has indicator state only the recent bars are needed
+        warm = symbol in self._ind_state
+        rates = self.get_candles(symbol, count=self.WARM_BARS if warm else 100)
+        if not len(rates):
             return {"signal": None, "confidence": 0, "reason": "No data"}
         
-        indicators = self.calculate_indicators(df)
+        indicators = self.calculate_indicators(rates, symbol)
+        if not indicators and warm:
+            # Bars were missed; rebuild the state from a full window
+            rates = self.get_candles(symbol, count=100)
+            if not len(rates):
+                return {"signal": None, "confidence": 0, "reason": "No data"}
+            indicators = self.calculate_indicators(rates, symbol)
         if not indicators:
             return {"signal": None, "confidence": 0, "reason": "Insufficient data"}
         
@@ -364,25 +604,15 @@ class MT5SmartTrader:
         account_balance = self.account_info.balance
         risk_amount = account_balance * (self.stats["current_risk_percent"] / 100)
         
-        symbol_info = SYMBOLS.get(symbol, {})
-        point = symbol_info.get("point", 0.00001)
-        
-        if "JPY" in symbol:
-            pip_value = 1000
-            sl_distance = stop_loss_pips * 0.01
-        elif symbol == "XAUUSD":
-            pip_value = 100
-            sl_distance = stop_loss_pips * 1.0
-        else:
-            pip_value = 10
-            sl_distance = stop_loss_pips * 0.0001
+        pip_value, pip_size, _ = _PIPS[symbol]
+        sl_distance = stop_loss_pips * pip_size
         
         lot_size = risk_amount / (sl_distance * pip_value)
         
-        mt5_info = mt5.symbol_info(symbol)
-        if mt5_info:
-            lot_size = max(lot_size, mt5_info.volume_min)
-            lot_size = min(lot_size, min(mt5_info.volume_max, TRADING_CONFIG.get("max_lot", 1.0)))
+        static = self.get_symbol_static(symbol)
+        if static:
+            lot_size = max(lot_size, static["volume_min"])
+            lot_size = min(lot_size, min(static["volume_max"], TRADING_CONFIG.get("max_lot", 1.0)))
         
         return round(lot_size, 2)
     
@@ -411,15 +641,9 @@ class MT5SmartTrader:
             tp_pips = TRADING_CONFIG.get("default_tp_pips", 30)
         
         point = symbol_info["point"]
-        if "JPY" in symbol:
-            sl_dist = sl_pips * point * 10
-            tp_dist = tp_pips * point * 10
-        elif symbol == "XAUUSD":
-            sl_dist = sl_pips * point
-            tp_dist = tp_pips * point
-        else:
-            sl_dist = sl_pips * point * 10
-            tp_dist = tp_pips * point * 10
+        points_per_pip = _PIPS[symbol][2]
+        sl_dist = sl_pips * point * points_per_pip
+        tp_dist = tp_pips * point * points_per_pip
         
         if order_type == "BUY":
             price = symbol_info["ask"]
@@ -445,7 +669,7 @@ class MT5SmartTrader:
             "type_filling": mt5.ORDER_FILLING_IOC,
         }
         
-        result = mt5.order_send(request)
+        result = self._send_order(request)
         
         if result.retcode == mt5.TRADE_RETCODE_DONE:
             trade = {
@@ -459,8 +683,9 @@ class MT5SmartTrader:
                 "open_time": datetime.now()
             }
             
-            self.stats["trades"] += 1
-            self.stats["last_trade_time"] = datetime.now()
+            with self._stats_lock:
+                self.stats["trades"] += 1
+                self.stats["last_trade_time"] = datetime.now()
             
             print(f"\n✅ {order_type} {symbol} opened - Lot: {lot}")
             
@@ -469,26 +694,33 @@ class MT5SmartTrader:
             print(f"❌ Trade failed: {result.comment}")
             return None
     
-    def close_trade(self, ticket: int) -> Tuple[bool, float]:
-        """Close a trade and return success/profit"""
+    def close_trade(self, ticket: int, price: float = None) -> Tuple[bool, float]:
+        """Close a trade and return success/profit
+        
+        price is the closing side's current quote if the caller already has it.
+        """
         positions = mt5.positions_get(ticket=ticket)
         if not positions:
             return False, 0
         
         pos = positions[0]
-        symbol = pos.symbol
-        volume = pos.volume
+        result = self._send_order(self._close_request(pos, price))
+        return self._record_close(pos, result)
+    
+    def _close_request(self, pos, price: float = None) -> dict:
+        """Deal request that closes pos at price (fetched if not given)"""
         order_type = "SELL" if pos.type == 0 else "BUY"
         
-        symbol_info = self.get_symbol_info(symbol)
-        price = symbol_info["ask"] if order_type == "BUY" else symbol_info["bid"]
+        if price is None:
+            symbol_info = self.get_symbol_info(pos.symbol)
+            price = symbol_info["ask"] if order_type == "BUY" else symbol_info["bid"]
         
-        request = {
+        return {
             "action": mt5.TRADE_ACTION_DEAL,
-            "symbol": symbol,
-            "volume": volume,
+            "symbol": pos.symbol,
+            "volume": pos.volume,
             "type": mt5.ORDER_TYPE_SELL if order_type == "SELL" else mt5.ORDER_TYPE_BUY,
-            "position": ticket,
+            "position": pos.ticket,
             "price": price,
             "deviation": 20,
             "magic": TRADING_CONFIG.get("magic_number", 123456),
@@ -496,24 +728,32 @@ class MT5SmartTrader:
             "type_time": mt5.ORDER_TIME_GTC,
             "type_filling": mt5.ORDER_FILLING_IOC,
         }
-        
-        result = mt5.order_send(request)
-        
+    
+    def _send_order(self, request: dict):
+        """order_send, serialized with other orders on the same symbol"""
+        symbol = request["symbol"]
+        lock = self._order_locks.get(symbol) or self._order_locks.setdefault(symbol, threading.Lock())
+        with lock:
+            return mt5.order_send(request)
+    
+    def _record_close(self, pos, result) -> Tuple[bool, float]:
+        """Update stats for a close attempt and return success/profit"""
         if result.retcode == mt5.TRADE_RETCODE_DONE:
             profit = pos.profit
             
-            if profit > 0:
-                self.stats["wins"] += 1
-                self.stats["profit"] += profit
-                self.stats["consecutive_wins"] += 1
-                self.stats["consecutive_losses"] = 0
-                print(f"\n🎯 WIN! {symbol} | Profit: ${profit:.2f}")
-            else:
-                self.stats["losses"] += 1
-                self.stats["profit"] += profit
-                self.stats["consecutive_losses"] += 1
-                self.stats["consecutive_wins"] = 0
-                print(f"\n❌ LOSS! {symbol} | Loss: ${profit:.2f}")
+            with self._stats_lock:
+                if profit > 0:
+                    self.stats["wins"] += 1
+                    self.stats["profit"] += profit
+                    self.stats["consecutive_wins"] += 1
+                    self.stats["consecutive_losses"] = 0
+                    print(f"\n🎯 WIN! {pos.symbol} | Profit: ${profit:.2f}")
+                else:
+                    self.stats["losses"] += 1
+                    self.stats["profit"] += profit
+                    self.stats["consecutive_losses"] += 1
+                    self.stats["consecutive_wins"] = 0
+                    print(f"\n❌ LOSS! {pos.symbol} | Loss: ${profit:.2f}")
             
             return True, profit
         
@@ -535,56 +775,75 @@ class MT5SmartTrader:
         
         return True, "OK"
     
-    def check_positions(self) -> List[dict]:
-        """Check and manage open positions"""
+    def _bot_positions(self) -> tuple:
+        """This bot's open positions from one positions_get call"""
         positions = mt5.positions_get()
         if positions is None:
-            return []
+            return ()
         
-        closed = []
         magic = TRADING_CONFIG.get("magic_number", 123456)
+        return tuple(p for p in positions if p.magic == magic)
+    
+    def check_positions(self, positions: tuple = None) -> List[dict]:
+        """Check and manage open positions
         
-        for pos in positions:
-            if pos.magic != magic:
-                continue
-            
-            symbol = pos.symbol
-            symbol_info = self.get_symbol_info(symbol)
-            if not symbol_info:
-                continue
-            
-            current_price = symbol_info["bid"] if pos.type == 0 else symbol_info["ask"]
-            
-            if pos.type == 0 and pos.tp > 0 and current_price >= pos.tp:
-                self.close_trade(pos.ticket)
-                closed.append({"ticket": pos.ticket, "reason": "TP", "symbol": symbol})
-                continue
-            elif pos.type == 1 and pos.tp > 0 and current_price <= pos.tp:
-                self.close_trade(pos.ticket)
-                closed.append({"ticket": pos.ticket, "reason": "TP", "symbol": symbol})
-                continue
-            
-            if pos.type == 0 and pos.sl > 0 and current_price <= pos.sl:
-                self.close_trade(pos.ticket)
-                closed.append({"ticket": pos.ticket, "reason": "SL", "symbol": symbol})
-                continue
-            elif pos.type == 1 and pos.sl > 0 and current_price >= pos.sl:
-                self.close_trade(pos.ticket)
-                closed.append({"ticket": pos.ticket, "reason": "SL", "symbol": symbol})
-                continue
+        positions is a _bot_positions() snapshot the caller already has.
+        """
+        if positions is None:
+            positions = self._bot_positions()
+        
+        closed = []
+        
+        # One quote per symbol per poll, however many positions it has
+        quotes: Dict[str, Optional[tuple]] = {}
+        symbols = [p.symbol for p in positions]
+        for symbol in set(symbols):
+            tick = mt5.symbol_info_tick(symbol)
+            if tick is None:
+                symbol_info = self.get_symbol_info(symbol)
+                quotes[symbol] = (symbol_info["bid"], symbol_info["ask"]) if symbol_info else None
+            else:
+                quotes[symbol] = (tick.bid, tick.ask)
+        
+        # TP / SL hits for all positions at once (no quote = never hit)
+        n = len(positions)
+        is_buy = np.fromiter((p.type == 0 for p in positions), dtype=bool, count=n)
+        is_sell = np.fromiter((p.type == 1 for p in positions), dtype=bool, count=n)
+        sl = np.fromiter((p.sl for p in positions), dtype=np.float64, count=n)
+        tp = np.fromiter((p.tp for p in positions), dtype=np.float64, count=n)
+        bids = np.fromiter((quotes[s][0] if quotes[s] else np.nan for s in symbols), dtype=np.float64, count=n)
+        asks = np.fromiter((quotes[s][1] if quotes[s] else np.nan for s in symbols), dtype=np.float64, count=n)
+        current = np.where(is_buy, bids, asks)
+        
+        hit_tp = (tp > 0) & ((is_buy & (current >= tp)) | (is_sell & (current <= tp)))
+        hit_sl = (sl > 0) & ((is_buy & (current <= sl)) | (is_sell & (current >= sl)))
+        
+        hits = np.flatnonzero(hit_tp | hit_sl)
+        close_requests = [self._close_request(positions[i], current[i]) for i in hits]
+        
+        # Independent closes go out together; stats are applied in position order
+        if len(close_requests) > 1:
+            results = list(self._pool.map(self._send_order, close_requests))
+        else:
+            results = [self._send_order(request) for request in close_requests]
+        
+        for i, result in zip(hits, results):
+            pos = positions[i]
+            self._record_close(pos, result)
+            closed.append({"ticket": pos.ticket, "reason": "TP" if hit_tp[i] else "SL", "symbol": pos.symbol})
         
         return closed
     
-    def get_open_positions(self) -> List[dict]:
-        """Get all open positions managed by bot"""
+    def get_open_positions(self, positions: tuple = None) -> List[dict]:
+        """Get all open positions managed by bot
+        
+        positions is a _bot_positions() snapshot the caller already has.
+        """
         if not self.connected:
             return []
         
-        positions = mt5.positions_get()
         if positions is None:
-            return []
-        
-        magic = TRADING_CONFIG.get("magic_number", 123456)
+            positions = self._bot_positions()
         
         return [
             {
@@ -599,12 +858,15 @@ class MT5SmartTrader:
                 "tp": p.tp,
             }
             for p in positions
-            if p.magic == magic
         ]
     
     def reset_daily_stats(self):
-        """Reset daily statistics"""
+        """Reset daily statistics (only looks at the date once midnight has passed)"""
+        if time.time() < self._next_reset:
+            return
+        
         today = datetime.now().date()
+        self._next_reset = _next_midnight(today)
         if self.stats["start_date"] != today:
             self.stats = {
                 "trades": 0,
@@ -618,58 +880,118 @@ class MT5SmartTrader:
                 "current_risk_percent": TRADING_CONFIG.get("default_risk_percent", 1.0),
             }
     
+    def start_background(self, symbols: List[str] = None, scan_interval: float = 1.0) -> bool:
+        """Run the trading loop in a daemon thread; False if one is already running
+        
+        A stopped loop that has not exited yet still counts, so two loops
+        never trade at once.
+        """
+        with self._start_lock:
+            if self.running or (self._loop_thread is not None and self._loop_thread.is_alive()):
+                return False
+            self.running = True
+            self._wake.clear()
+            self._loop_thread = threading.Thread(target=self._loop, args=(symbols, scan_interval), daemon=True)
+            self._loop_thread.start()
+            return True
+    
     def run(self, symbols: List[str] = None, scan_interval: float = 1.0):
         """Main trading loop"""
+        self.running = True
+        self._wake.clear()
+        self._loop(symbols, scan_interval)
+    
+    def _loop(self, symbols: Optional[List[str]], scan_interval: float):
+        """Body of run(); running is already set"""
         if symbols is None:
             symbols = list(SYMBOLS.keys())
         
-        self.running = True
         self.reset_daily_stats()
         
         print(f"\n" + "="*50)
         print("🚀 SMART TRADING BOT STARTED")
         print("="*50)
         
+        # Trading limits are fixed for the session
+        max_open = TRADING_CONFIG.get("max_open_trades", 3)
+        min_confidence = STRATEGY_CONFIG.get("min_confidence", 50)
+        sl_pips = TRADING_CONFIG.get("default_sl_pips", 20)
+        tp_pips = TRADING_CONFIG.get("default_tp_pips", 30)
+        max_spread = TRADING_CONFIG.get("max_spread", 30)
+        
+        # Quiet scans stretch the pause up to max_pause; any activity resets it
+        max_pause = max(scan_interval, 5.0)
+        pause = scan_interval
+        last_require_stronger = None
+        
         while self.running:
             try:
                 self.reset_daily_stats()
                 self.news_manager.update_news()
-                self.check_positions()
+                
+                # One positions read per tick; re-read only if something was closed
+                positions = self._bot_positions()
+                if self.check_positions(positions):
+                    positions = self._bot_positions()
                 
                 can_trade, reason = self.can_trade()
                 if not can_trade:
-                    time.sleep(scan_interval)
+                    self._wake.wait(scan_interval)
                     continue
                 
-                open_pos = self.get_open_positions()
                 require_stronger = self.stats["consecutive_losses"] > 0
+                if require_stronger != last_require_stronger:
+                    # The signal threshold changed, so every symbol needs a fresh look
+                    self._last_quote.clear()
+                    last_require_stronger = require_stronger
+                
+                # The scan only needs symbols and a count, not position dicts;
+                # symbols without a new tick since a signal-less analysis, or
+                # with too wide a spread, are skipped
+                held = {p.symbol for p in positions}
+                n_open = len(positions)
+                quotes = self._fresh_quotes([symbol for symbol in symbols if symbol not in held], max_spread) if n_open < max_open else {}
+                candidates = list(quotes)
                 
-                for symbol in symbols:
-                    if any(p["symbol"] == symbol for p in open_pos):
-                        continue
-                    
-                    if len(open_pos) >= TRADING_CONFIG.get("max_open_trades", 3):
+                # Analyze all candidates concurrently; results come back in symbol order
+                analyses = list(self._pool.map(
+                    lambda symbol: self.analyze_market(symbol, require_stronger), candidates
+                ))
+                
+                # Take signals in symbol order up to the open-trade limit
+                to_open = []
+                for symbol, analysis in zip(candidates, analyses):
+                    if n_open + len(to_open) >= max_open:
                         break
-                    
-                    analysis = self.analyze_market(symbol, require_stronger)
-                    
-                    if analysis["signal"] and analysis["confidence"] >= STRATEGY_CONFIG.get("min_confidence", 50):
-                        self.open_trade(
-                            symbol=symbol,
-                            order_type=analysis["signal"],
-                            sl_pips=TRADING_CONFIG.get("default_sl_pips", 20),
-                            tp_pips=TRADING_CONFIG.get("default_tp_pips", 30)
-                        )
-                        time.sleep(1)
+                    if analysis["signal"] and analysis["confidence"] >= min_confidence:
+                        to_open.append((symbol, analysis["signal"]))
+                
+                # Signal-less symbols wait for a new tick; any signal is looked at again
+                for symbol, analysis in zip(candidates, analyses):
+                    if analysis["signal"]:
+                        self._last_quote.pop(symbol, None)
+                    else:
+                        self._last_quote[symbol] = quotes[symbol]
                 
-                time.sleep(scan_interval)
+                # Orders on different symbols are independent, so they go out together
+                if len(to_open) > 1:
+                    list(self._pool.map(lambda order: self.open_trade(*order, sl_pips=sl_pips, tp_pips=tp_pips), to_open))
+                elif to_open:
+                    self.open_trade(*to_open[0], sl_pips=sl_pips, tp_pips=tp_pips)
+                
+                # Open positions need their TP/SL watched at full pace
+                if positions or to_open:
+                    pause = scan_interval
+                else:
+                    pause = min(pause * 1.5, max_pause)
+                self._wake.wait(pause)
                 
             except KeyboardInterrupt:
                 print("\n🛑 Bot stopped by user")
                 break
             except Exception as e:
                 print(f"Error: {e}")
-                time.sleep(scan_interval)
+                self._wake.wait(scan_interval)
         
         self.running = False
     
@@ -712,13 +1034,42 @@ try:
 except ImportError:
     app = Flask(__name__)
     
+    _CORS_HEADERS = {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type, Authorization',
+    }
+    
     @app.after_request
     def add_cors_headers(response):
-        response.headers['Access-Control-Allow-Origin'] = '*'
-        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization'
+        response.headers.update(_CORS_HEADERS)
         return response
 
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+    
+    class ORJSONProvider(DefaultJSONProvider):
+        """orjson-backed API responses, same output conventions as the default
+        
+        Two differences from the stdlib provider: NaN/Infinity (e.g. an RSI
+        before enough bars) come out as null rather than NaN/Infinity, and
+        small floats are written without an exponent (0.00001, not 1e-05).
+        """
+        
+        # Dates still go through DefaultJSONProvider.default (HTTP dates)
+        OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode()
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+    
+    app.json = ORJSONProvider(app)
+except ImportError:
+    pass
+
 trader = MT5SmartTrader()
 
 @app.route('/api/status')
@@ -761,16 +1112,15 @@ def start():
         trader.connect()
     
     if trader.connected:
-        thread = threading.Thread(target=trader.run, args=(symbols,))
-        thread.daemon = True
-        thread.start()
+        if not trader.start_background(symbols):
+            return jsonify({"success": True, "message": "Already running"})
         return jsonify({"success": True})
     
     return jsonify({"success": False, "error": "Not connected"})
 
 @app.route('/api/stop', methods=['POST'])
 def stop():
-    trader.running = False
+    trader.stop()
     return jsonify({"success": True})
 
 @app.route('/api/analysis/<symbol>')
@@ -838,69 +1188,88 @@ def prices():
     if not trader.connected:
         return jsonify({"error": "Not connected"})
     
-    result = []
-    for symbol in SYMBOLS.keys():
-        info = trader.get_symbol_info(symbol)
-        if info:
-            result.append({
-                "symbol": symbol,
-                "bid": info["bid"],
-                "ask": info["ask"],
-                "spread": info["spread"],
-            })
-    return jsonify(result)
+    return jsonify(trader.get_prices())
+
+# SYMBOLS is fixed at import, so the /api/symbols body is serialized once
+# (compact, with jsonify's trailing newline)
+_SYMBOLS_JSON = json.dumps(list(SYMBOLS), separators=(",", ":")) + "\n"
+
 
 @app.route('/api/symbols')
 def symbols():
     """Get available symbols"""
-    return jsonify(list(SYMBOLS.keys()))
+    return app.response_class(_SYMBOLS_JSON, mimetype="application/json")
 
 
 if __name__ == "__main__":
+    import argparse
+    import getpass
     import sys
     
-    if len(sys.argv) > 1 and sys.argv[1] == "--api":
+    parser = argparse.ArgumentParser(description="Meta Trader 5 Smart Bot")
+    parser.add_argument("--api", action="store_true", help="Serve the dashboard API (auto-connects to demo)")
+    parser.add_argument("--account", choices=["demo", "real"], help="Account type; skips the interactive menu")
+    parser.add_argument("--login", type=int, help="MT5 login (defaults to the configured account)")
+    parser.add_argument("--password",
+                        help="MT5 password; visible in ps and shell history, so prefer MT5_PASSWORD / "
+                             "MT5_REAL_PASSWORD (or .env), or leave it out to be prompted")
+    parser.add_argument("--server", help="MT5 server")
+    args = parser.parse_args()
+    if args.account is None and (args.login or args.password or args.server):
+        parser.error("--login, --password and --server need --account")
+    
+    if args.api:
         from config import API_HOST, API_PORT, MT5_DEMO
         
         # Auto-connect on API start
         print("Auto-connecting to MT5...")
         if trader.connect("demo"):
             print("✅ Auto-connected to MT5")
-            thread = threading.Thread(target=trader.run, args=(list(SYMBOLS.keys()), 1.0))
-            thread.daemon = True
-            thread.start()
+            trader.start_background(list(SYMBOLS.keys()), 1.0)
             print("🚀 Auto-trading started")
         else:
             print("⚠️ Auto-connect failed - API available but MT5 not connected")
         
         print(f"Starting API on {API_HOST}:{API_PORT}")
         print(f"API: http://localhost:5000")
-        app.run(host=API_HOST, port=API_PORT, debug=False)
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(host=API_HOST, port=API_PORT, debug=False, threaded=True)
+        else:
+            serve(app, host=API_HOST, port=API_PORT, threads=8, connection_limit=64)
     else:
-        trader = MT5SmartTrader()
-        
-        print("\n" + "="*50)
-        print("META TRADER 5 SMART BOT")
-        print("="*50)
-        print("\nSelect account type:")
-        print("1. Demo Account")
-        print("2. Real Account")
-        choice = input("Choice (1/2): ").strip()
-        
-        account_type = "demo" if choice == "1" else "real"
-        
-        if choice == "2":
-            print("\nEnter your MT5 credentials:")
-            try:
-                login = int(input("Login (account number): "))
-                password = input("Password: ")
-                server = input("Server (e.g., ICMarkets-Demo): ")
-            except:
-                print("Invalid input, using demo")
-                account_type = "demo"
-                login = password = server = None
+        account_type = args.account
+        login, password, server = args.login, args.password, args.server
+        
+        if account_type is not None:
+            # A real account with no password given or configured is asked for one
+            if account_type == "real" and password is None and not MT5_REAL["password"] and sys.stdin.isatty():
+                password = getpass.getpass("Password: ")
+        elif sys.stdin.isatty():
+            # Only show the menu when nothing was given on the command line and someone is there to answer
+            print("\n" + "="*50)
+            print("META TRADER 5 SMART BOT")
+            print("="*50)
+            print("\nSelect account type:")
+            print("1. Demo Account")
+            print("2. Real Account")
+            choice = input("Choice (1/2): ").strip()
+            
+            account_type = "demo" if choice == "1" else "real"
+            
+            if choice == "2":
+                print("\nEnter your MT5 credentials:")
+                try:
+                    login = int(input("Login (account number): "))
+                    password = getpass.getpass("Password: ")
+                    server = input("Server (e.g., ICMarkets-Demo): ")
+                except:
+                    print("Invalid input, using demo")
+                    account_type = "demo"
+                    login = password = server = None
         else:
-            login = password = server = None
+            account_type = "demo"
         
         if trader.connect(account_type, login, password, server):
             try:
@@ -4,10 +4,15 @@ ML-SuperTrend Advanced Bot Runner
 Usage: python run_advanced_bot.py
 """
 
+import os
 import sys
 import argparse
+import atexit
+import functools
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+from types import MappingProxyType
 
 # Load .env so MT5_LOGIN, MT5_PASSWORD, MT5_SERVER are used automatically
 try:
@@ -25,35 +30,85 @@ except ImportError:
     sys.exit(1)
 
 from core.advanced_trading_bot import AdvancedTradingBot, BotConfig, StrategyConfig
+from core.env_config import mt5_env_overrides
 
 
-def setup_logging():
+def _daily_file_handler():
+    """Handler for logs/bot.log, rolled over at midnight to logs/bot_YYYYMMDD.log"""
+    handler = logging.handlers.TimedRotatingFileHandler('logs/bot.log', when='midnight')
+    handler.suffix = '%Y%m%d'
+    handler.namer = lambda name: name.replace('bot.log.', 'bot_') + '.log'
+    return handler
+
+
+def setup_logging(log_level='INFO'):
     """Setup logging"""
+    os.makedirs('logs', exist_ok=True)
+    
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [
+        _daily_file_handler(),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Log calls only enqueue; a background thread does the file/console writes
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # force: replace any handler an earlier import (e.g. core.advanced_trading_bot) set up
     logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(f'logs/bot_{datetime.now().strftime("%Y%m%d")}.log'),
-            logging.StreamHandler()
-        ]
+        level=getattr(logging, log_level.upper()),
+        handlers=[queue_handler],
+        force=True
     )
 
 
+# Account used when MT5_LOGIN / MT5_PASSWORD / MT5_SERVER are not set
+_ACCOUNT_DEFAULTS = {'login': 0, 'password': '', 'server': 'MetaQuotes-Demo'}
+
+# Other environment settings read by load_config_from_env: name -> (default, parser)
+_ENV_SETTINGS = {
+    'MT5_SYMBOLS': ('EURUSD,GBPUSD', lambda v: tuple(s.strip() for s in v.split(','))),
+    'MT5_TIMEFRAME': ('16385', int),  # M30
+    'MIN_STRENGTH': ('60', float),
+    'RISK_PERCENT': ('1.0', float),
+    'MAX_POSITIONS': ('2', int),
+    'MAX_SPREAD': ('3.0', float),
+    'MAX_DAILY_LOSS': ('5.0', float),
+    'MAX_DAILY_TRADES': ('10', int),
+}
+
+
+@functools.cache
+def _env_snapshot():
+    """Parsed environment settings, read once per process"""
+    return MappingProxyType({
+        name: parse(os.getenv(name, default)) for name, (default, parse) in _ENV_SETTINGS.items()
+    })
+
+
 def load_config_from_env():
     """Load configuration from environment or use defaults"""
-    import os
+    env = _env_snapshot()
+    account = {**_ACCOUNT_DEFAULTS, **mt5_env_overrides()}
     
     return BotConfig(
-        login=int(os.getenv('MT5_LOGIN', '0') or 0),
-        password=os.getenv('MT5_PASSWORD', ''),
-        server=os.getenv('MT5_SERVER', 'MetaQuotes-Demo'),
-        symbols=os.getenv('MT5_SYMBOLS', 'EURUSD,GBPUSD').split(','),
-        timeframe=int(os.getenv('MT5_TIMEFRAME', '16385')),  # M30
+        login=account['login'],
+        password=account['password'],
+        server=account['server'],
+        symbols=list(env['MT5_SYMBOLS']),
+        timeframe=env['MT5_TIMEFRAME'],
         strategies=[StrategyConfig(
             name="Advanced",
-            min_strength=float(os.getenv('MIN_STRENGTH', '60')),
-            risk_percent=float(os.getenv('RISK_PERCENT', '1.0')),
-            max_positions=int(os.getenv('MAX_POSITIONS', '2')),
+            min_strength=env['MIN_STRENGTH'],
+            risk_percent=env['RISK_PERCENT'],
+            max_positions=env['MAX_POSITIONS'],
             use_trailing=True,
             use_partial_close=True,
             partial_close_percent=50,
@@ -62,12 +117,15 @@ def load_config_from_env():
             trailing_start_at=2.0,
         )],
         news_filter_enabled=True,
-        max_spread=float(os.getenv('MAX_SPREAD', '3.0')),
-        max_daily_loss=float(os.getenv('MAX_DAILY_LOSS', '5.0')),
-        max_daily_trades=int(os.getenv('MAX_DAILY_TRADES', '10')),
+        max_spread=env['MAX_SPREAD'],
+        max_daily_loss=env['MAX_DAILY_LOSS'],
+        max_daily_trades=env['MAX_DAILY_TRADES'],
     )
 
 
+_RULE = "=" * 60
+
+
 def main():
     parser = argparse.ArgumentParser(description='ML-SuperTrend Advanced Bot')
     parser.add_argument('--login', type=int, help='MT5 Login')
@@ -77,14 +135,18 @@ def main():
     parser.add_argument('--risk', type=float, default=1.0, help='Risk percent per trade')
     parser.add_argument('--interval', type=int, default=60, help='Update interval in seconds')
     parser.add_argument('--dry-run', action='store_true', help='Dry run mode')
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help='Logging level (default: INFO)')
     
     args = parser.parse_args()
     
-    setup_logging()
+    setup_logging(args.log_level)
     
     # Create config
     config = load_config_from_env()
     
+    strategy = config.strategies[0]
+    
     # Override with command line args
     if args.login:
         config.login = args.login
@@ -95,16 +157,18 @@ def main():
     if args.symbols:
         config.symbols = [s.strip() for s in args.symbols.split(',')]
     if args.risk:
-        config.strategies[0].risk_percent = args.risk
+        strategy.risk_percent = args.risk
     
-    print("=" * 60)
-    print("ML-SuperTrend Advanced Trading Bot")
-    print("=" * 60)
-    print(f"Symbols: {', '.join(config.symbols)}")
-    print(f"Risk: {config.strategies[0].risk_percent}%")
-    print(f"Max Positions: {config.strategies[0].max_positions}")
-    print(f"Update Interval: {args.interval} seconds")
-    print("=" * 60)
+    print("\n".join((
+        _RULE,
+        "ML-SuperTrend Advanced Trading Bot",
+        _RULE,
+        f"Symbols: {', '.join(config.symbols)}",
+        f"Risk: {strategy.risk_percent}%",
+        f"Max Positions: {strategy.max_positions}",
+        f"Update Interval: {args.interval} seconds",
+        _RULE,
+    )))
     
     if args.dry_run:
         print("DRY RUN MODE - No real trades will be placed")
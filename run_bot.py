@@ -5,52 +5,109 @@ Main entry point for the trading bot
 Author: xPOURY4
 """
 
-import os
 import sys
 import json
 import argparse
+import atexit
+import functools
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
 from pathlib import Path
+from types import MappingProxyType
 
-# Load .env so MT5 credentials can be set there (no code edit needed)
+# orjson parses the config bytes directly when installed
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    from orjson import loads as _json_loads
 except ImportError:
-    pass
+    _json_loads = json.loads
 
-try:
-    import MetaTrader5 as mt5
-except ImportError:
-    print("Error: MetaTrader5 module not found.")
-    print("Please install it using: pip install MetaTrader5")
-    sys.exit(1)
 
-from core.supertrend_bot import SuperTrendBot, Config
-from core.performance_monitor import PerformanceMonitor
+@functools.lru_cache(maxsize=1)
+def _mt5():
+    """The MetaTrader5 module, imported on first use so --help stays light"""
+    try:
+        import MetaTrader5 as mt5
+    except ImportError:
+        print("Error: MetaTrader5 module not found.")
+        print("Please install it using: pip install MetaTrader5")
+        sys.exit(1)
+    return mt5
+
+
+@functools.lru_cache(maxsize=1)
+def _timeframe_map():
+    """Timeframe names used in config.json -> MT5 timeframe constants"""
+    mt5 = _mt5()
+    return MappingProxyType({
+        "M1": mt5.TIMEFRAME_M1,
+        "M5": mt5.TIMEFRAME_M5,
+        "M15": mt5.TIMEFRAME_M15,
+        "M30": mt5.TIMEFRAME_M30,
+        "H1": mt5.TIMEFRAME_H1,
+        "H4": mt5.TIMEFRAME_H4,
+        "D1": mt5.TIMEFRAME_D1
+    })
+
+
+_BANNER = (
+    "\n"
+    "============================================================\n"
+    "                 ML-SuperTrend MT5 Trading Bot\n"
+    "                 Author: xPOURY4\n"
+    "                 GitHub: https://github.com/xPOURY4/ML-SuperTrend-MT5\n"
+    "                 EDUCATIONAL PURPOSES ONLY - TRADE AT YOUR OWN RISK\n"
+    "============================================================\n"
+)
+
+# Printed instead when the console cannot encode the banner
+_BANNER_FALLBACK = "ML-SuperTrend MT5 Trading Bot - EDUCATIONAL PURPOSES ONLY"
+
+
+def _daily_file_handler():
+    """Handler for logs/bot.log, rolled over at midnight to logs/bot_YYYYMMDD.log"""
+    handler = logging.handlers.TimedRotatingFileHandler("logs/bot.log", when="midnight")
+    handler.suffix = "%Y%m%d"
+    handler.namer = lambda name: name.replace("bot.log.", "bot_") + ".log"
+    return handler
 
 
 def setup_logging(log_level="INFO"):
     """Setup logging configuration"""
     Path("logs").mkdir(parents=True, exist_ok=True)
 
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers = [
+        _daily_file_handler(),
+        logging.StreamHandler(sys.stdout)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Log calls only enqueue; a background thread does the file/console writes
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # force: replace any handler an earlier import (e.g. core.advanced_trading_bot) set up
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format=log_format,
-        handlers=[
-            logging.FileHandler(f"logs/bot_{datetime.now().strftime('%Y%m%d')}.log"),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[queue_handler],
+        force=True
     )
     
     return logging.getLogger(__name__)
 
 
 def load_config(config_file="config/config.json"):
-    """Load configuration from JSON file"""
+    """Load configuration from JSON file
+    
+    The parsed dict is cached per file and mtime and shared between
+    callers, so copy any part of it before changing it.
+    """
     config_path = Path(config_file)
     
     if not config_path.exists():
@@ -58,8 +115,13 @@ def load_config(config_file="config/config.json"):
         print("Please copy config.example.json to config.json and update with your settings.")
         sys.exit(1)
     
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    return _parse_config(str(config_path.resolve()), config_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(path, mtime_ns):
+    """Parsed config file, reused until the file's mtime changes"""
+    return _json_loads(Path(path).read_bytes())
 
 
 def parse_arguments():
@@ -125,30 +187,21 @@ def parse_arguments():
 
 def print_banner():
     """Print application banner"""
-    banner = (
-        "\n"
-        "============================================================\n"
-        "                 ML-SuperTrend MT5 Trading Bot\n"
-        "                 Author: xPOURY4\n"
-        "                 GitHub: https://github.com/xPOURY4/ML-SuperTrend-MT5\n"
-        "                 EDUCATIONAL PURPOSES ONLY - TRADE AT YOUR OWN RISK\n"
-        "============================================================\n"
-    )
     try:
-        print(banner)
+        print(_BANNER)
     except UnicodeEncodeError:
-        print("ML-SuperTrend MT5 Trading Bot - EDUCATIONAL PURPOSES ONLY")
+        print(_BANNER_FALLBACK)
 
 
 def validate_mt5_connection(login, password, server):
     """Validate MT5 connection"""
-    if not mt5.initialize():
-        return False, "Failed to initialize MT5"
+    mt5 = _mt5()
     
-    if not mt5.login(login, password=password, server=server):
+    # initialize() logs in too when given the credentials (one terminal round trip)
+    if not mt5.initialize(login=login, password=password, server=server):
         error = mt5.last_error()
         mt5.shutdown()
-        return False, f"Login failed: {error}"
+        return False, f"Failed to initialize MT5 / log in: {error}"
     
     account_info = mt5.account_info()
     if account_info is None:
@@ -165,12 +218,23 @@ def main():
     # Parse arguments
     args = parse_arguments()
     
+    # Load .env so MT5 credentials can be set there (no code edit needed)
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+    
+    # Trading imports are only needed once the arguments are valid
+    mt5 = _mt5()
+    from core.env_config import mt5_env_overrides
+    from core.supertrend_bot import SuperTrendBot, Config
+    
     # Setup logging
     logger = setup_logging(args.log_level)
     logger.info("Starting ML-SuperTrend Bot...")
     
-    # Create necessary directories
-    Path("logs").mkdir(exist_ok=True)
+    # logs/ was created by setup_logging
     Path("reports").mkdir(exist_ok=True)
     
     # Load configuration
@@ -189,18 +253,7 @@ def main():
     account_config = dict(raw_account)
     
     # Env overrides: set MT5_LOGIN, MT5_PASSWORD, MT5_SERVER in .env or environment
-    env_login = os.getenv("MT5_LOGIN")
-    env_password = os.getenv("MT5_PASSWORD")
-    env_server = os.getenv("MT5_SERVER")
-    if env_login is not None and env_login != "":
-        try:
-            account_config["login"] = int(env_login)
-        except ValueError:
-            logger.warning("MT5_LOGIN must be a number, ignoring")
-    if env_password is not None:
-        account_config["password"] = env_password
-    if env_server is not None and env_server != "":
-        account_config["server"] = env_server
+    account_config.update(mt5_env_overrides())
     
     # Get symbol configuration
     symbol_config = config_data["symbols"].get(args.symbol)
@@ -227,19 +280,9 @@ def main():
     logger.info(f"Leverage: 1:{account_info.leverage}")
     
     # Create bot configuration
-    timeframe_map = {
-        "M1": mt5.TIMEFRAME_M1,
-        "M5": mt5.TIMEFRAME_M5,
-        "M15": mt5.TIMEFRAME_M15,
-        "M30": mt5.TIMEFRAME_M30,
-        "H1": mt5.TIMEFRAME_H1,
-        "H4": mt5.TIMEFRAME_H4,
-        "D1": mt5.TIMEFRAME_D1
-    }
-    
     bot_config = Config(
         symbol=args.symbol,
-        timeframe=timeframe_map.get(symbol_config["timeframe"], mt5.TIMEFRAME_M30),
+        timeframe=_timeframe_map().get(symbol_config["timeframe"], mt5.TIMEFRAME_M30),
         atr_period=config_data["global_settings"]["atr_period"],
         min_factor=symbol_config["min_factor"],
         max_factor=symbol_config["max_factor"],
@@ -284,6 +327,7 @@ def main():
         # Show performance report if requested
         if args.monitor:
             logger.info("Generating performance report...")
+            from core.performance_monitor import PerformanceMonitor
             monitor = PerformanceMonitor()
             monitor.generate_report(days=30)
     
@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.performance_monitor import PerformanceMonitor
+
+
+def _trade(profit, days_ago):
+    close_time = (datetime.now() - timedelta(days=days_ago)).isoformat()
+    return {"symbol": "EURUSD", "type": "BUY", "profit": profit, "close_time": close_time}
+
+
+def test_old_float_profit_does_not_change_window_total_type(capsys):
+    monitor = PerformanceMonitor()
+    monitor.add_trade(_trade(0.5, days_ago=60))
+    monitor.add_trade(_trade(2, days_ago=2))
+    monitor.add_trade(_trade(1, days_ago=1))
+
+    stats = monitor.generate_report(days=30)
+
+    assert stats["total_profit"] == 3
+    assert type(stats["total_profit"]) is int
+    assert "$3 " in capsys.readouterr().out
+
+
+def test_float_profit_in_window_totals_to_float():
+    monitor = PerformanceMonitor()
+    monitor.add_trade(_trade(2, days_ago=2))
+    monitor.add_trade(_trade(1.5, days_ago=1))
+
+    stats = monitor.get_stats(days=30)
+
+    assert stats["total_profit"] == 3.5
+    assert type(stats["total_profit"]) is float
+    assert stats["best_trade"] == 2
+    assert type(stats["best_trade"]) is int
+
+
+def test_trades_is_read_only():
+    monitor = PerformanceMonitor()
+    monitor.add_trade(_trade(1, days_ago=1))
+
+    with pytest.raises(AttributeError):
+        monitor.trades.append(_trade(2, days_ago=1))
+    with pytest.raises(TypeError):
+        monitor.trades[0]["profit"] = 5
+
+    assert len(monitor.trades) == 1
+    assert monitor.trades[0]["profit"] == 1